@@ -2,6 +2,17 @@ from typing import Protocol
 
 from typing_extensions import Self
 
+# Indentation strings for the common nesting depths, built once up front
+_INDENT_UNIT = "    "
+_INDENTS = tuple(_INDENT_UNIT * i for i in range(64))
+
+
+def indent_str(level: int) -> str:
+    """Leading whitespace for a line nested ``level`` levels deep."""
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return _INDENT_UNIT * level
+
 
 class SupportsStr(Protocol):
     def __str__(self) -> str: ...
@@ -12,7 +23,32 @@ class Body:
         self.lines: list[SupportsStr] = []
 
     def __str__(self) -> str:
-        return "\n".join(map(str, self.lines))
+        out: list[str] = []
+        self._write(out, 0)
+        return "\n".join(out)
+
+    def _write(self, out: list[str], indent: int) -> None:
+        """
+        Append the rendered lines of this body to ``out``, indented by
+        ``indent`` levels.
+
+        Nested bodies write directly into the same list, so a tree of bodies
+        is rendered in a single pass rather than being stringified and
+        re-indented at every nesting level. Whitespace-only lines are never
+        indented, matching :func:`textwrap.indent`.
+        """
+        if not self.lines:
+            # An empty body still renders as a single blank line
+            out.append("")
+            return
+
+        pad = indent_str(indent)
+        for item in self.lines:
+            if isinstance(item, Body):
+                item._write(out, indent)
+                continue
+            for line in str(item).split("\n"):
+                out.append(pad + line if line.strip() else line)
 
     def __add__(self, other: SupportsStr) -> Self:
         self.lines.append(other)
@@ -1,10 +1,9 @@
-from textwrap import indent
-
-from .body import Body
+from .body import Body, indent_str
 
 
 class CombinationalBody(Body):
-    def __str__(self) -> str:
-        return f"""always_comb begin
-{indent(super().__str__(), "    ")}
-end"""
+    def _write(self, out: list[str], indent: int) -> None:
+        pad = indent_str(indent)
+        out.append(f"{pad}always_comb begin")
+        super()._write(out, indent + 1)
+        out.append(f"{pad}end")
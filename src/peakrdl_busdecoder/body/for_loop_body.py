@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from textwrap import indent
-
-from .body import Body
+from .body import Body, indent_str
 
 
 class ForLoopBody(Body):
@@ -12,7 +10,10 @@ class ForLoopBody(Body):
         self._iterator = iterator
         self._dim = dim
 
-    def __str__(self) -> str:
-        return f"""for ({self._type} {self._iterator} = 0; {self._iterator} < {self._dim}; {self._iterator}++) begin
-{indent(super().__str__(), "    ")}
-end"""
+    def _write(self, out: list[str], indent: int) -> None:
+        pad = indent_str(indent)
+        out.append(
+            f"{pad}for ({self._type} {self._iterator} = 0; {self._iterator} < {self._dim}; {self._iterator}++) begin"
+        )
+        super()._write(out, indent + 1)
+        out.append(f"{pad}end")
@@ -1,9 +1,8 @@
-from textwrap import indent
 from types import EllipsisType
 
 from typing_extensions import Self
 
-from .body import Body, SupportsStr
+from .body import Body, SupportsStr, indent_str
 
 
 class IfBody(Body):
@@ -69,22 +68,27 @@ class IfBody(Body):
         return IfBody._BranchCtx(self, condition)
 
     # --- Rendering ---
-    def __str__(self) -> str:
-        out: list[str] = []
+    def _write(self, out: list[str], indent: int) -> None:
+        if not self._branches:
+            out.append("")
+            return
+
+        pad = indent_str(indent)
         for i, (cond, body) in enumerate(self._branches):
             if cond is None:
                 assert i != 0, "Else branch cannot be the first branch."
                 out[-1] += " else begin"
             elif i == 0:
-                out.append(f"if ({cond}) begin")
+                out.append(f"{pad}if ({cond}) begin")
             else:
                 out[-1] += f" else if ({cond}) begin"
 
-            body_str = str(body)
-            if body_str:
-                out.extend(indent(ln, "    ") for ln in body_str.splitlines())
-            out.append("end")
-        return "\n".join(out)
+            start = len(out)
+            body._write(out, indent + 1)
+            # Drop the trailing blank line, so an empty branch renders nothing
+            if len(out) > start and not out[-1]:
+                out.pop()
+            out.append(f"{pad}end")
 
     def __len__(self) -> int:
         return len(self._branches)
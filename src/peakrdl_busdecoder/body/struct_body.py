@@ -1,6 +1,4 @@
-from textwrap import indent
-
-from .body import Body
+from .body import Body, indent_str
 
 
 class StructBody(Body):
@@ -14,12 +12,11 @@ class StructBody(Body):
     def name(self) -> str:
         return self._name
 
-    def __str__(self) -> str:
+    def _write(self, out: list[str], indent: int) -> None:
+        pad = indent_str(indent)
         if self._typedef:
-            return f"""typedef struct {"packed " if self._packed else ""}{{
-{indent(super().__str__(), "    ")}
-}} {self._name};"""
-
-        return f"""struct {{
-{indent(super().__str__(), "    ")}
-}} {self._name};"""
+            out.append(f"{pad}typedef struct {'packed ' if self._packed else ''}{{")
+        else:
+            out.append(f"{pad}struct {{")
+        super()._write(out, indent + 1)
+        out.append(f"{pad}}} {self._name};")
@@ -4,7 +4,6 @@ from typing import ClassVar
 from systemrdl.node import AddressableNode
 
 from ...sv_int import SVInt
-from ...utils import get_indexed_path
 from ..base_cpuif import BaseCpuif
 from .apb_interface import APBFlatInterface, APBSVInterface
 
@@ -146,7 +145,7 @@ class APBCpuifBase(BaseCpuif):
 
         addr_width = self.addr_width_param(node)
 
-        sel_path = get_indexed_path(self.exp.ds.top_node, node, "gi")
+        sel_path = self.exp.ds.indexed_path(node, "gi")
         sel_expr = f"cpuif_wr_sel.{sel_path}|cpuif_rd_sel.{sel_path}"
 
         if self.clk_src == "cpuif":
@@ -5,7 +5,6 @@ from systemrdl.node import AddressableNode
 
 from peakrdl_busdecoder.sv_int import SVInt
 
-from ...utils import get_indexed_path
 from ..base_cpuif import BaseCpuif
 from .axi4_lite_interface import AXI4LiteFlatInterface, AXI4LiteSVInterface
 
@@ -49,8 +48,8 @@ class AXI4LiteCpuifFlat(BaseCpuif):
 
         addr_width = self.addr_width_param(node)
 
-        wr_sel = f"cpuif_wr_sel.{get_indexed_path(self.exp.ds.top_node, node, 'gi')}"
-        rd_sel = f"cpuif_rd_sel.{get_indexed_path(self.exp.ds.top_node, node, 'gi')}"
+        wr_sel = f"cpuif_wr_sel.{self.exp.ds.indexed_path(node, 'gi')}"
+        rd_sel = f"cpuif_rd_sel.{self.exp.ds.indexed_path(node, 'gi')}"
 
         if self.clk_src == "cpuif":
             fanout[self.signal("ACLK", node, "gi")] = self.signal("ACLK")
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING, ClassVar
 import jinja2 as jj
 from systemrdl.node import AddressableNode
 
-from ..utils import clog2, get_indexed_path, is_pow2, roundup_pow2
+from ..template_cache import BYTECODE_CACHE
+from ..utils import clog2, is_pow2, roundup_pow2
 from .fanin_gen import FaninGenerator
 from .fanin_intermediate_gen import FaninIntermediateGenerator
 from .fanout_gen import FanoutGenerator
@@ -200,7 +201,7 @@ class BaseCpuif:
         allocated by the fanin/fanout generators (see
         ``BusDecoderListener.loop_base_index``).
         """
-        indexed = get_indexed_path(self.exp.ds.top_node, node, indexer, skip_kw_filter=True)
+        indexed = self.exp.ds.indexed_path(node, indexer, skip_kw_filter=True)
         return "".join(re.findall(r"\[[^\]]*\]", indexed))
 
     @staticmethod
@@ -221,13 +222,14 @@ class BaseCpuif:
         jj_env = jj.Environment(
             loader=loader,
             undefined=jj.StrictUndefined,
+            bytecode_cache=BYTECODE_CACHE,
         )
         jj_env.tests["array"] = self.check_is_array  # type: ignore
         jj_env.filters["clog2"] = clog2
         jj_env.filters["is_pow2"] = is_pow2
         jj_env.filters["roundup_pow2"] = roundup_pow2
         jj_env.filters["address_slice"] = self.get_address_slice
-        jj_env.filters["get_path"] = lambda x: get_indexed_path(self.exp.ds.top_node, x, "i")
+        jj_env.filters["get_path"] = lambda x: self.exp.ds.indexed_path(x, "i")
         jj_env.filters["walk"] = self.exp.walk
 
         context = {
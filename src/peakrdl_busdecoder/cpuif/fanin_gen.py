@@ -7,7 +7,6 @@ from systemrdl.walker import WalkerAction
 from ..body import Body, CombinationalBody, ForLoopBody, IfBody
 from ..design_state import DesignState
 from ..listener import BusDecoderListener
-from ..utils import get_indexed_path
 
 if TYPE_CHECKING:
     from .base_cpuif import BaseCpuif
@@ -43,12 +42,12 @@ class FaninGenerator(BusDecoderListener):
 
         if should_generate:
             ifb = IfBody()
-            with ifb.cm(f"cpuif_wr_sel.{get_indexed_path(self._cpuif.exp.ds.top_node, node)}") as b:
+            with ifb.cm(f"cpuif_wr_sel.{self._cpuif.exp.ds.indexed_path(node)}") as b:
                 b += self._cpuif.fanin_wr(node)
             self._stack[-1] += ifb
 
             ifb = IfBody()
-            with ifb.cm(f"cpuif_rd_sel.{get_indexed_path(self._cpuif.exp.ds.top_node, node)}") as b:
+            with ifb.cm(f"cpuif_rd_sel.{self._cpuif.exp.ds.indexed_path(node)}") as b:
                 b += self._cpuif.fanin_rd(node)
             self._stack[-1] += ifb
 
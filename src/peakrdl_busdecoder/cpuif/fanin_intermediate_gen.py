@@ -16,7 +16,6 @@ from systemrdl.walker import WalkerAction
 from ..body import Body, ForLoopBody
 from ..design_state import DesignState
 from ..listener import BusDecoderListener
-from ..utils import get_indexed_path
 
 if TYPE_CHECKING:
     from .base_cpuif import BaseCpuif
@@ -87,7 +86,7 @@ class FaninIntermediateGenerator(BusDecoderListener):
 
     def _open_dim_brackets(self, node: AddressableNode, indexer: str) -> str:
         """Bracket string covering all open dims, e.g. ``[gi0][gi1]``."""
-        indexed = get_indexed_path(self._ds.top_node, node, indexer, skip_kw_filter=True)
+        indexed = self._ds.indexed_path(node, indexer, skip_kw_filter=True)
         return "".join(re.findall(r"\[[^\]]*\]", indexed))
 
     def _generate_intermediate_declarations(self, node: AddressableNode) -> None:
@@ -6,13 +6,12 @@ from typing import TYPE_CHECKING
 
 from systemrdl.node import AddressableNode
 
-from ..utils import get_indexed_path
-
 if TYPE_CHECKING:
+    from ..design_state import DesignState
     from .base_cpuif import BaseCpuif
 
 
-def _open_dim_brackets(top_node: AddressableNode, node: AddressableNode, indexer: str) -> str:
+def _open_dim_brackets(ds: "DesignState", node: AddressableNode, indexer: str) -> str:
     """Bracket-index string covering every open array dimension of ``node``.
 
     Walks the path from the top node so rolled array *ancestors* contribute
@@ -20,7 +19,7 @@ def _open_dim_brackets(top_node: AddressableNode, node: AddressableNode, indexer
     loop-variable numbers match those allocated positionally from the open-dim
     stride stack (see ``BusDecoderListener.loop_base_index``).
     """
-    indexed = get_indexed_path(top_node, node, indexer, skip_kw_filter=True)
+    indexed = ds.indexed_path(node, indexer, skip_kw_filter=True)
     return "".join(re.findall(r"\[[^\]]*\]", indexed))
 
 
@@ -142,7 +141,7 @@ class SVInterface(Interface):
         # Index by *all* open dimensions: walk from the top node so ancestor
         # array brackets (e.g. blk[gi0]) are included, then keep only the
         # bracket expressions to append after the (possibly qualified) base.
-        brackets = _open_dim_brackets(self.cpuif.exp.ds.top_node, node, indexer)
+        brackets = _open_dim_brackets(self.cpuif.exp.ds, node, indexer)
         return f"{master_prefix}{base}{brackets}.{signal}"
 
     @abstractmethod
@@ -204,7 +203,7 @@ class FlatInterface(Interface):
         # Is an array (possibly by virtue of rolled array ancestors)
         if indexer is not None:
             if isinstance(indexer, str):
-                brackets = _open_dim_brackets(self.cpuif.exp.ds.top_node, node, indexer)
+                brackets = _open_dim_brackets(self.cpuif.exp.ds, node, indexer)
                 return f"{base}_{signal}{brackets}"
 
             return f"{base}_{signal}[{indexer}]"
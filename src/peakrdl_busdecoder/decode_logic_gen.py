@@ -7,21 +7,19 @@ from systemrdl.walker import WalkerAction
 from .body import Body, ForLoopBody, IfBody
 from .design_state import DesignState
 from .listener import BusDecoderListener
-from .sv_int import SVInt
-from .utils import get_indexed_path
 
 
 class DecodeLogicFlavor(Enum):
     READ = "rd"
     WRITE = "wr"
 
-    @property
-    def cpuif_address(self) -> str:
-        return f"cpuif_{self.value}_addr"
+    cpuif_address: str
+    cpuif_select: str
 
-    @property
-    def cpuif_select(self) -> str:
-        return f"cpuif_{self.value}_sel"
+    def __init__(self, value: str) -> None:
+        # Signal names are read for every decoded node, so build them once per member
+        self.cpuif_address = f"cpuif_{value}_addr"
+        self.cpuif_select = f"cpuif_{value}_sel"
 
 
 class DecodeLogicGenerator(BusDecoderListener):
@@ -40,42 +38,19 @@ class DecodeLogicGenerator(BusDecoderListener):
         self._decode_stack.append(IfBody())
 
     def cpuif_addr_predicate(self, node: AddressableNode, total_size: bool = True) -> list[str]:
-        # Generate address bounds
-        addr_width = self._ds.addr_width
-        l_bound = SVInt(
-            node.raw_absolute_address,
-            addr_width,
-        )
-        if total_size:
-            u_bound = l_bound + SVInt(node.total_size, addr_width)
-        else:
-            u_bound = l_bound + SVInt(node.size, addr_width)
-
-        array_stack = list(self._array_stride_stack)
+        array_stack = tuple(self._array_stride_stack)
         if total_size and node.array_dimensions:
             array_stack = array_stack[: -len(node.array_dimensions)]
 
-        # Handle arrayed components
-        l_bound_comp = [str(l_bound)]
-        u_bound_comp = [str(u_bound)]
-        for i, stride in enumerate(array_stack):
-            l_bound_comp.append(f"(i{i}*{SVInt(stride, addr_width)})")
-            u_bound_comp.append(f"(i{i}*{SVInt(stride, addr_width)})")
-
-        if len(l_bound_comp) == 1:
-            lower_expr = f"{self._flavor.cpuif_address} >= {l_bound_comp[0]}"
-            upper_expr = f"{self._flavor.cpuif_address} < {u_bound_comp[0]}"
-        else:
-            lower_expr = f"{self._flavor.cpuif_address} >= {self._ds.addr_width}'({'+'.join(l_bound_comp)})"
-            upper_expr = f"{self._flavor.cpuif_address} < {self._ds.addr_width}'({'+'.join(u_bound_comp)})"
+        # The bounds do not depend on the flavor, so the read and write
+        # decoders share them through the design state.
+        lower, upper = self._ds.addr_bounds(node, total_size, array_stack)
 
         predicates: list[str] = []
-        # Avoid generating a redundant >= 0 comparison, which triggers Verilator warnings.
-        if not (l_bound.value == 0 and len(l_bound_comp) == 1):
-            predicates.append(lower_expr)
-        # Avoid generating a redundant full-width < max comparison, which triggers Verilator warnings.
-        if not (u_bound.value == (1 << addr_width) and len(u_bound_comp) == 1):
-            predicates.append(upper_expr)
+        if lower is not None:
+            predicates.append(f"{self._flavor.cpuif_address} >= {lower}")
+        if upper is not None:
+            predicates.append(f"{self._flavor.cpuif_address} < {upper}")
 
         if not predicates:
             # If there are no predicates, return a tautology to avoid generating empty conditions.
@@ -118,7 +93,7 @@ class DecodeLogicGenerator(BusDecoderListener):
             # non-arrayed component with if-body
             ifb = self._decode_stack[-1]
             with ifb.cm(condition) as b:
-                b += f"{self._flavor.cpuif_select}.{get_indexed_path(self._ds.top_node, node)} = 1'b1;"
+                b += f"{self._flavor.cpuif_select}.{self._ds.indexed_path(node)} = 1'b1;"
 
         return action
 
@@ -136,7 +111,7 @@ class DecodeLogicGenerator(BusDecoderListener):
             condition = " && ".join(f"({c})" for c in conditions)
 
             with ifb.cm(condition) as b:
-                b += f"{self._flavor.cpuif_select}.{get_indexed_path(self._ds.top_node, node)} = 1'b1;"
+                b += f"{self._flavor.cpuif_select}.{self._ds.indexed_path(node)} = 1'b1;"
         self._decode_stack[-1] += ifb
 
         for _ in node.array_dimensions:
@@ -11,7 +11,8 @@ from .design_scanner import DesignScanner
 from .identifier_filter import kw_filter as kwf
 from .node_meta import NodeMeta
 from .rdl_params import ParameterUsage, RdlParameter
-from .utils import clog2
+from .sv_int import SVInt
+from .utils import clog2, get_indexed_path
 
 
 class DesignStateKwargs(TypedDict, total=False):
@@ -74,6 +75,10 @@ class DesignState:
         # don't recompute the same predicates on each pass.
         self._node_meta: dict[str, NodeMeta] = {}
         self._addressable_children_cache: dict[tuple[int, bool], list[AddressableNode]] = {}
+        # Address-decode bounds shared by the read and write decoders
+        self._addr_bounds_cache: dict[tuple[str, bool, tuple[int, ...]], tuple[str | None, str | None]] = {}
+        # Indexed select paths, requested by several generators per node
+        self._indexed_path_cache: dict[tuple[str, str, bool], str] = {}
 
         # Scan the design to fill in above variables.
         scanner = DesignScanner(self)
@@ -85,6 +90,12 @@ class DesignState:
         self._master_port_names = self._compute_master_port_names()
         self._struct_type_names = self._compute_struct_type_names()
 
+        # Rolled-up paths of every decode-boundary node, so the generators can
+        # test a node with one set lookup instead of re-deriving the rules.
+        self._decode_boundary_paths = frozenset(
+            self._normalized_path(node) for node in self.get_addressable_children_at_depth(unroll=False)
+        )
+
         if self.cpuif_data_width == 0:
             # Scanner did not find any registers in the design being exported,
             # so the width is not known.
@@ -249,6 +260,58 @@ class DesignState:
             meta = self._node_meta[re.sub(r"\[\d+\]", "[]", path)]
         return meta
 
+    def is_decode_boundary(self, node: AddressableNode) -> bool:
+        """Whether the decoder stops descending at ``node`` (see
+        :meth:`get_addressable_children_at_depth` for the rules)."""
+        path = node.get_path()
+        if path in self._decode_boundary_paths:
+            return True
+        # Unrolled element nodes carry concrete indices in their path
+        return "[" in path and re.sub(r"\[\d+\]", "[]", path) in self._decode_boundary_paths
+
+    def indexed_path(self, node: AddressableNode, indexer: str = "i", skip_kw_filter: bool = False) -> str:
+        """Memoized :func:`~peakrdl_busdecoder.utils.get_indexed_path` from the top node."""
+        key = (node.get_path(), indexer, skip_kw_filter)
+        path = self._indexed_path_cache.get(key)
+        if path is None:
+            path = get_indexed_path(self.top_node, node, indexer, skip_kw_filter)
+            self._indexed_path_cache[key] = path
+        return path
+
+    def addr_bounds(
+        self, node: AddressableNode, total_size: bool, array_stack: tuple[int, ...]
+    ) -> tuple[str | None, str | None]:
+        """Right-hand sides of the lower/upper address comparisons that decode
+        ``node``, or ``None`` where the comparison would be redundant.
+
+        ``array_stack`` holds the strides of the enclosing open loop dimensions.
+        Results are memoized, as they are shared by the read and write decoders.
+        """
+        key = (node.get_path(), total_size, array_stack)
+        bounds = self._addr_bounds_cache.get(key)
+        if bounds is not None:
+            return bounds
+
+        # Bounds are computed as plain integers and formatted once each
+        addr_width = self.addr_width
+        l_bound = node.raw_absolute_address
+        u_bound = l_bound + (node.total_size if total_size else node.size)
+
+        if not array_stack:
+            # Avoid generating a redundant >= 0 comparison, which triggers Verilator warnings.
+            lower = None if l_bound == 0 else str(SVInt(l_bound, addr_width))
+            # Avoid generating a redundant full-width < max comparison, which triggers Verilator warnings.
+            upper = None if u_bound == (1 << addr_width) else str(SVInt(u_bound, addr_width))
+        else:
+            # Arrayed components: the per-dimension offset terms are identical for
+            # both bounds, so build them once
+            offset = "".join(f"+(i{i}*{SVInt(stride, addr_width)})" for i, stride in enumerate(array_stack))
+            lower = f"{addr_width}'({SVInt(l_bound, addr_width)}{offset})"
+            upper = f"{addr_width}'({SVInt(u_bound, addr_width)}{offset})"
+
+        bounds = self._addr_bounds_cache[key] = (lower, upper)
+        return bounds
+
     def get_enable_param_for_dimension(self, node: AddressableNode, dim_index: int) -> RdlParameter | None:
         """
         Look up the enable parameter for a specific array dimension of a node.
@@ -275,7 +338,7 @@ class DesignState:
         - N: decode down to depth N
 
         A node is a decode boundary when any of these hold, matching the rules
-        the walker-based generators apply in ``BusDecoderListener.should_skip_node``
+        the walker-based generators apply through :meth:`is_decode_boundary`
         (the port list and the decode/fanout/fanin logic must always agree on
         the same set of nodes):
 
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Any, TypedDict
 
 import jinja2 as jj
 from systemrdl.node import AddrmapNode, RootNode
-from systemrdl.walker import RDLSteerableWalker
 from typing_extensions import Unpack
 
 from .cpuif import BaseCpuif
@@ -16,8 +15,10 @@ from .identifier_filter import kw_filter as kwf
 from .listener import BusDecoderListener
 from .struct_gen import StructGenerator
 from .sv_int import SVInt
+from .template_cache import BYTECODE_CACHE
 from .utils import clog2
 from .validate_design import DesignValidator
+from .walker import AddressableWalker
 
 
 class ExporterKwargs(TypedDict, total=False):
@@ -61,6 +62,7 @@ class BusDecoderExporter:
         self.jj_env = jj.Environment(
             loader=c_loader,
             undefined=jj.StrictUndefined,
+            bytecode_cache=BYTECODE_CACHE,
         )
         self.jj_env.filters["kwf"] = kwf
         self.jj_env.filters["walk"] = self.walk
@@ -121,6 +123,54 @@ class BusDecoderExporter:
             requires ``clk_src='design'`` (uses the design clk/rst). APB
             handshake is preserved via PREADY-stretching.
         """
+        files = self.render(node, **kwargs)
+
+        # Write out design. Files whose contents are unchanged are left alone,
+        # so re-exporting an unmodified design does not touch their mtimes.
+        os.makedirs(output_dir, exist_ok=True)
+        for file_name, text in files.items():
+            _write_if_changed(os.path.join(output_dir, file_name), text)
+
+    def render(self, node: RootNode | AddrmapNode, **kwargs: Unpack[ExporterKwargs]) -> dict[str, str]:
+        """
+        Generate the SystemVerilog sources without writing them to disk.
+
+        Accepts the same keyword arguments as :meth:`export`.
+
+        Returns
+        -------
+        dict[str, str]
+            Generated file contents keyed by file name: the package
+            definition followed by the module definition.
+        """
+        self.validate(node, **kwargs)
+
+        # Build Jinja template context
+        context = {
+            "version": version("peakrdl-busdecoder"),
+            "cpuif": self.cpuif,
+            "cpuif_decode": DecodeLogicGenerator,
+            "cpuif_select": StructGenerator,
+            "cpuif_decode_flavor": DecodeLogicFlavor,
+            "ds": self.ds,
+            "SVInt": SVInt,
+        }
+
+        package_text = self.jj_env.get_template("package_tmpl.sv").render(context)
+        module_text = self.jj_env.get_template("module_tmpl.sv").render(context)
+        return {
+            self.ds.package_name + ".sv": package_text,
+            self.ds.module_name + ".sv": module_text,
+        }
+
+    def validate(self, node: RootNode | AddrmapNode, **kwargs: Unpack[ExporterKwargs]) -> None:
+        """
+        Elaborate the design state and run all design rule checks without
+        generating any output.
+
+        Accepts the same keyword arguments as :meth:`export`. Raises
+        ``RDLCompileError`` if the design cannot be exported.
+        """
         # If it is the root node, skip to top addrmap
         if isinstance(node, RootNode):
             top_node = node.top
@@ -141,34 +191,22 @@ class BusDecoderExporter:
         # Validate that there are no unsupported constructs
         DesignValidator(self).do_validate()
 
-        # Build Jinja template context
-        context = {
-            "version": version("peakrdl-busdecoder"),
-            "cpuif": self.cpuif,
-            "cpuif_decode": DecodeLogicGenerator,
-            "cpuif_select": StructGenerator,
-            "cpuif_decode_flavor": DecodeLogicFlavor,
-            "ds": self.ds,
-            "SVInt": SVInt,
-        }
-
-        # Write out design
-        os.makedirs(output_dir, exist_ok=True)
-        package_file_path = os.path.join(output_dir, self.ds.package_name + ".sv")
-        template = self.jj_env.get_template("package_tmpl.sv")
-        stream = template.stream(context)
-        stream.dump(package_file_path)
-
-        module_file_path = os.path.join(output_dir, self.ds.module_name + ".sv")
-        template = self.jj_env.get_template("module_tmpl.sv")
-        stream = template.stream(context)
-        stream.dump(module_file_path)
-
     def walk(self, listener_cls: type[BusDecoderListener], **kwargs: dict[str, Any]) -> str:
         # Port-referencing listeners walk unrolled when cpuif_unroll is set, so
         # each array element is fanned out/in as an individual master port.
         unroll = self.ds.cpuif_unroll and listener_cls.walk_unrolled
-        walker = RDLSteerableWalker(unroll=unroll)
+        walker = AddressableWalker(unroll=unroll)
         listener = listener_cls(self.ds, **kwargs)
         walker.walk(self.ds.top_node, listener, skip_top=True)
         return str(listener)
+
+
+def _write_if_changed(path: str, text: str) -> None:
+    """Write ``text`` to ``path`` as UTF-8 unless the file already holds exactly that."""
+    data = text.encode("utf-8")
+    try:
+        if os.path.getsize(path) == len(data) and Path(path).read_bytes() == data:
+            return
+    except OSError:
+        pass
+    Path(path).write_bytes(data)
@@ -1,6 +1,6 @@
 from collections import deque
 
-from systemrdl.node import AddressableNode, RegNode
+from systemrdl.node import AddressableNode
 from systemrdl.walker import RDLListener, WalkerAction
 
 from .design_state import DesignState
@@ -15,7 +15,6 @@ class BusDecoderListener(RDLListener):
     def __init__(self, ds: DesignState) -> None:
         self._array_stride_stack: deque[int] = deque()  # Tracks nested array strides
         self._ds = ds
-        self._depth = 0
 
     def is_rolled_array(self, node: AddressableNode) -> bool:
         """True for an arrayed node visited rolled-up (not an unrolled element)."""
@@ -37,26 +36,9 @@ class BusDecoderListener(RDLListener):
 
     def should_skip_node(self, node: AddressableNode) -> bool:
         """Check if this node should be skipped (not decoded)."""
-        # Check if current depth exceeds max depth
-        # max_decode_depth semantics:
-        # - 0 means decode all levels (infinite)
-        # - 1 means decode only top level (depth 0)
-        # - 2 means decode top + 1 level (depth 0 and 1)
-        # - N means decode down to depth N-1
-        if self._ds.max_decode_depth > 0 and self._depth >= self._ds.max_decode_depth:
-            return True
-
-        # Check if this node only contains external addressable children
-        if node != self._ds.top_node and not isinstance(node, RegNode):
-            if self._ds.node_meta(node).has_only_external_addressable_children:
-                return True
-
-        # A leaf addressable node (register, memory, empty block) is always a
-        # decode boundary, even when it sits shallower than max_decode_depth.
-        if node != self._ds.top_node and not self._ds.node_meta(node).has_addressable_children:
-            return True
-
-        return False
+        # Decode boundaries (depth limit, leaf nodes, blocks holding only
+        # external children) are precomputed once per design.
+        return node != self._ds.top_node and self._ds.is_decode_boundary(node)
 
     def enter_AddressableComponent(self, node: AddressableNode) -> WalkerAction | None:
         meta = self._ds.node_meta(node)
@@ -66,8 +48,6 @@ class BusDecoderListener(RDLListener):
             # loop_base_index).
             self._array_stride_stack.extend(meta.array_strides)
 
-        self._depth += 1
-
         # Check if we should skip this node's descendants
         if self.should_skip_node(node):
             return WalkerAction.SkipDescendants
@@ -80,7 +60,5 @@ class BusDecoderListener(RDLListener):
             for _ in node.array_dimensions:
                 self._array_stride_stack.pop()
 
-        self._depth -= 1
-
     def __str__(self) -> str:
         return ""
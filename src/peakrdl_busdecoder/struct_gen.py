@@ -3,7 +3,7 @@ from collections import deque
 from systemrdl.node import AddressableNode
 from systemrdl.walker import WalkerAction
 
-from .body import StructBody
+from .body import Body, StructBody
 from .design_state import DesignState
 from .identifier_filter import kw_filter as kwf
 from .listener import BusDecoderListener
@@ -52,8 +52,7 @@ class StructGenerator(BusDecoderListener):
         name = kwf(node.inst_name)
 
         if node.array_dimensions:
-            for dim in node.array_dimensions:
-                name = f"{name}[{dim}]"
+            name += "".join(f"[{dim}]" for dim in node.array_dimensions)
 
         self._stack[-1] += f"{type} {name};"
 
@@ -62,6 +61,9 @@ class StructGenerator(BusDecoderListener):
     def __str__(self) -> str:
         if "logic cpuif_err;" not in self._stack[-1].lines:
             self._stack[-1] += "logic cpuif_err;"
-        bodies = [str(body) for body in self._struct_defs]
-        bodies.append(str(self._stack[-1]))
-        return "\n".join(bodies)
+        # Render every typedef into one line buffer in a single pass
+        bodies = Body()
+        for body in self._struct_defs:
+            bodies += body
+        bodies += self._stack[-1]
+        return str(bodies)
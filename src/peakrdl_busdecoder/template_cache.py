@@ -0,0 +1,33 @@
+from types import CodeType
+
+import jinja2 as jj
+
+
+class MemoryBytecodeCache(jj.BytecodeCache):
+    """
+    Process-wide store of compiled template code.
+
+    Every exporter builds its own Jinja environment because some filters are
+    bound to the exporter instance. Sharing the compiled code between those
+    environments means each template is parsed and compiled once per process
+    rather than once per export. Entries are checked against the template
+    source, so an edited template is recompiled.
+    """
+
+    def __init__(self) -> None:
+        self._code: dict[str, tuple[str, CodeType]] = {}
+
+    def load_bytecode(self, bucket: jj.bccache.Bucket) -> None:
+        entry = self._code.get(bucket.key)
+        if entry is not None and entry[0] == bucket.checksum:
+            bucket.code = entry[1]
+
+    def dump_bytecode(self, bucket: jj.bccache.Bucket) -> None:
+        if bucket.code is not None:
+            self._code[bucket.key] = (bucket.checksum, bucket.code)
+
+    def clear(self) -> None:
+        self._code.clear()
+
+
+BYTECODE_CACHE = MemoryBytecodeCache()
@@ -0,0 +1,101 @@
+from collections.abc import Callable
+
+from systemrdl.node import (
+    AddressableNode,
+    AddrmapNode,
+    FieldNode,
+    MemNode,
+    Node,
+    RegfileNode,
+    RegNode,
+    RootNode,
+    SignalNode,
+)
+from systemrdl.walker import RDLListener, WalkerAction
+
+# Listener callbacks for each node type, in the order RDLSteerableWalker calls them
+_ENTER_CALLBACKS: dict[type[Node], tuple[str, ...]] = {
+    AddrmapNode: ("enter_Component", "enter_AddressableComponent", "enter_Addrmap"),
+    RegfileNode: ("enter_Component", "enter_AddressableComponent", "enter_Regfile"),
+    MemNode: ("enter_Component", "enter_AddressableComponent", "enter_Mem"),
+    RegNode: ("enter_Component", "enter_AddressableComponent", "enter_Reg"),
+    FieldNode: ("enter_Component", "enter_VectorComponent", "enter_Field"),
+    SignalNode: ("enter_Component", "enter_VectorComponent", "enter_Signal"),
+}
+_EXIT_CALLBACKS: dict[type[Node], tuple[str, ...]] = {
+    AddrmapNode: ("exit_Addrmap", "exit_AddressableComponent", "exit_Component"),
+    RegfileNode: ("exit_Regfile", "exit_AddressableComponent", "exit_Component"),
+    MemNode: ("exit_Mem", "exit_AddressableComponent", "exit_Component"),
+    RegNode: ("exit_Reg", "exit_AddressableComponent", "exit_Component"),
+    FieldNode: ("exit_Field", "exit_VectorComponent", "exit_Component"),
+    SignalNode: ("exit_Signal", "exit_VectorComponent", "exit_Component"),
+}
+
+_Callbacks = tuple[Callable[[Node], WalkerAction | None], ...]
+
+
+def _overridden(listener: RDLListener, names: tuple[str, ...]) -> _Callbacks:
+    """Bound callbacks of ``listener`` among ``names`` that are not RDLListener's no-ops."""
+    return tuple(
+        getattr(listener, name)
+        for name in names
+        if getattr(type(listener), name) is not getattr(RDLListener, name)
+    )
+
+
+class AddressableWalker:
+    """
+    Iterative depth-first walker with the semantics of ``RDLSteerableWalker``.
+
+    Every listener callback is dispatched in the same order as
+    ``RDLSteerableWalker``, and ``SkipDescendants`` and ``StopNow`` are
+    honoured. Callbacks a listener does not override are never called, and
+    fields and signals are only visited when one of their callbacks is
+    overridden. Bus decoder listeners only react to addressable components, so
+    for them the walk never descends into registers' fields. Traversal uses an
+    explicit stack, so deep hierarchies are not bound by the interpreter's
+    recursion limit.
+    """
+
+    def __init__(self, unroll: bool = False) -> None:
+        self.unroll = unroll
+
+    def walk(self, node: Node, listener: RDLListener, skip_top: bool = False) -> None:
+        dispatch = {
+            node_cls: (
+                _overridden(listener, _ENTER_CALLBACKS[node_cls]),
+                _overridden(listener, _EXIT_CALLBACKS[node_cls]),
+            )
+            for node_cls in _ENTER_CALLBACKS
+        }
+        # Fields and signals are leaves; walking them only matters if the
+        # listener reacts to one of their callbacks
+        visit_vectors = any(callbacks for cls in (FieldNode, SignalNode) for callbacks in dispatch[cls])
+
+        def children(parent: Node) -> list[Node]:
+            return [
+                child
+                for child in parent.children(unroll=self.unroll)
+                if visit_vectors or isinstance(child, AddressableNode)
+            ]
+
+        # Each entry is (node, exiting). A node is pushed once to be entered and,
+        # once entered, again beneath its children to be exited.
+        roots = children(node) if skip_top or isinstance(node, RootNode) else [node]
+        stack: list[tuple[Node, bool]] = [(root, False) for root in reversed(roots)]
+
+        while stack:
+            current, exiting = stack.pop()
+            enter_callbacks, exit_callbacks = dispatch[type(current)]
+
+            action = WalkerAction.Continue
+            for callback in exit_callbacks if exiting else enter_callbacks:
+                action = max(action, callback(current) or WalkerAction.Continue)
+                if action == WalkerAction.StopNow:
+                    return
+            if exiting:
+                continue
+
+            stack.append((current, True))
+            if action != WalkerAction.SkipDescendants:
+                stack.extend((child, False) for child in reversed(children(current)))
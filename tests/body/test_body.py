@@ -1,4 +1,4 @@
-from peakrdl_busdecoder.body import Body
+from peakrdl_busdecoder.body import Body, ForLoopBody, IfBody
 
 
 class TestBody:
@@ -45,3 +45,15 @@ class TestBody:
         outer += "outer2"
         expected = "outer1\ninner1\ninner2\nouter2"
         assert str(outer) == expected
+
+    def test_nested_bodies_indent_per_level(self) -> None:
+        """Test that each nesting level adds one indent, leaving blank lines bare."""
+        loop = ForLoopBody("int", "i0", 2)
+        loop += "a = 1;\n\nb = 2;"
+        ifb = IfBody()
+        with ifb.cm("sel") as b:
+            b += loop
+        outer = Body()
+        outer += ifb
+        expected = "if (sel) begin\n    for (int i0 = 0; i0 < 2; i0++) begin\n        a = 1;\n\n        b = 2;\n    end\nend"
+        assert str(outer) == expected
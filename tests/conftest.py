@@ -9,7 +9,7 @@ collect_ignore_glob = [
 ]
 
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -21,15 +21,22 @@ _SHIM_DIR = Path(__file__).resolve().parents[1] / "tools" / "shims"
 os.environ["PATH"] = f"{_SHIM_DIR}{os.pathsep}{os.environ.get('PATH', '')}"
 
 
-@pytest.fixture
-def compile_rdl(tmp_path: Path) -> Callable[..., AddrmapNode]:
+@pytest.fixture(scope="session")
+def compile_rdl(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., AddrmapNode]:
     """Compile inline SystemRDL source and return the elaborated root node.
 
+    Compilation is memoized for the whole session on the source text and
+    compile options, so tests sharing an RDL snippet elaborate it only once.
+    The returned nodes are shared and must be treated as read-only. A design
+    whose compiler has reported an error is recompiled on its next request.
+
     Parameters
     ----------
-    tmp_path:
-        Temporary directory provided by pytest.
+    tmp_path_factory:
+        Session temporary directory factory provided by pytest.
     """
+    rdl_dir = tmp_path_factory.mktemp("rdl")
+    cache: dict[tuple[Hashable, ...], AddrmapNode] = {}
 
     def _compile(
         source: str,
@@ -38,9 +45,21 @@ def compile_rdl(tmp_path: Path) -> Callable[..., AddrmapNode]:
         defines: dict[str, str] | None = None,
         include_paths: list[Path | str] | None = None,
     ) -> AddrmapNode:
+        key = (
+            source,
+            top,
+            tuple(sorted(defines.items())) if defines else None,
+            tuple(map(str, include_paths)) if include_paths else None,
+        )
+        cached = cache.get(key)
+        # A previous test may have exported this design into an error; its
+        # compiler's message handler is left flagged, so elaborate afresh
+        if cached is not None and not cached.env.msg.had_error:
+            return cached
+
         compiler = RDLCompiler()
         # Use delete=False to keep the file around after closing
-        with NamedTemporaryFile("w", suffix=".rdl", dir=tmp_path, delete=False) as tmp_file:
+        with NamedTemporaryFile("w", suffix=".rdl", dir=rdl_dir, delete=False) as tmp_file:
             tmp_file.write(source)
             tmp_file.flush()
 
@@ -52,13 +71,16 @@ def compile_rdl(tmp_path: Path) -> Callable[..., AddrmapNode]:
                 )
                 if top is not None:
                     root = compiler.elaborate(top)
-                    return root.top
-                root = compiler.elaborate()
-                return root.top
+                else:
+                    root = compiler.elaborate()
             except RDLCompileError:
                 # Print error messages if available
                 if hasattr(compiler, "print_messages"):
                     compiler.print_messages()
                 raise
 
+        # RootNode.top builds a new node on every access; hand out the cached one
+        top_node = cache[key] = root.top
+        return top_node
+
     return _compile
@@ -1,15 +1,26 @@
+import re
 from collections.abc import Callable
 from pathlib import Path
 
+import jinja2 as jj
+import pytest
 from systemrdl.node import AddrmapNode
 
 from peakrdl_busdecoder import BusDecoderExporter
 from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif
 
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+
+def _identifiers(text: str) -> set[str]:
+    """Every SystemVerilog identifier/keyword token in ``text``, collected in one pass."""
+    return set(_IDENTIFIER.findall(text))
+
 
 class TestBusDecoderExporter:
     """Test the top-level BusDecoderExporter."""
 
+    @pytest.mark.slow
     def test_simple_register_export(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting a simple register."""
         rdl_source = """
@@ -32,17 +43,15 @@ class TestBusDecoderExporter:
         module_file = tmp_path / "simple_reg.sv"
         package_file = tmp_path / "simple_reg_pkg.sv"
 
-        assert module_file.exists()
-        assert package_file.exists()
-
         # Check basic content
         module_content = module_file.read_text()
         assert "module simple_reg" in module_content
-        assert "my_reg" in module_content
+        assert {"simple_reg", "my_reg"} <= _identifiers(module_content)
 
         package_content = package_file.read_text()
         assert "package simple_reg_pkg" in package_content
 
+    @pytest.mark.slow
     def test_register_array_export(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting a register array."""
         rdl_source = """
@@ -63,12 +72,11 @@ class TestBusDecoderExporter:
 
         # Check that output files are created
         module_file = tmp_path / "reg_array.sv"
-        assert module_file.exists()
-
         module_content = module_file.read_text()
         assert "module reg_array" in module_content
-        assert "my_regs" in module_content
+        assert {"reg_array", "my_regs"} <= _identifiers(module_content)
 
+    @pytest.mark.slow
     def test_nested_addrmap_export(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting nested addrmaps."""
         rdl_source = """
@@ -94,13 +102,11 @@ class TestBusDecoderExporter:
 
         # Check that output files are created
         module_file = tmp_path / "outer_block.sv"
-        assert module_file.exists()
-
         module_content = module_file.read_text()
         assert "module outer_block" in module_content
-        assert "inner" in module_content
-        assert "inner_reg" in module_content
+        assert {"outer_block", "inner", "inner_reg"} <= _identifiers(module_content)
 
+    @pytest.mark.slow
     def test_custom_module_name(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting with custom module name."""
         rdl_source = """
@@ -123,12 +129,13 @@ class TestBusDecoderExporter:
         module_file = tmp_path / "custom_module.sv"
         package_file = tmp_path / "custom_module_pkg.sv"
 
-        assert module_file.exists()
-        assert package_file.exists()
-
         module_content = module_file.read_text()
         assert "module custom_module" in module_content
 
+        package_content = package_file.read_text()
+        assert "package custom_module_pkg" in package_content
+
+    @pytest.mark.slow
     def test_custom_package_name(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting with custom package name."""
         rdl_source = """
@@ -149,11 +156,10 @@ class TestBusDecoderExporter:
 
         # Check that output files use custom package name
         package_file = tmp_path / "custom_pkg.sv"
-        assert package_file.exists()
-
         package_content = package_file.read_text()
         assert "package custom_pkg" in package_content
 
+    @pytest.mark.slow
     def test_multiple_registers(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """Test exporting multiple registers."""
         rdl_source = """
@@ -187,14 +193,13 @@ class TestBusDecoderExporter:
         exporter.export(top, output_dir, cpuif_cls=APB4Cpuif)
 
         module_file = tmp_path / "multi_reg.sv"
-        assert module_file.exists()
-
         module_content = module_file.read_text()
         assert "module multi_reg" in module_content
         assert "reg1" in module_content
         assert "reg2" in module_content
         assert "reg3" in module_content
 
+    @pytest.mark.slow
     def test_master_address_widths_export(
         self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path
     ) -> None:
@@ -236,14 +241,13 @@ class TestBusDecoderExporter:
         exporter.export(top, output_dir, cpuif_cls=APB4Cpuif)
 
         package_file = tmp_path / "parent_pkg.sv"
-        assert package_file.exists()
-
         package_content = package_file.read_text()
         assert "package parent_pkg" in package_content
         # Check for master address width parameters
         assert "localparam PARENT_C1_ADDR_WIDTH = 3" in package_content
         assert "localparam PARENT_C2_ADDR_WIDTH = 2" in package_content
 
+    @pytest.mark.slow
     def test_master_address_widths_with_arrays(
         self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path
     ) -> None:
@@ -275,9 +279,111 @@ class TestBusDecoderExporter:
         exporter.export(top, output_dir, cpuif_cls=APB4Cpuif)
 
         package_file = tmp_path / "parent_pkg.sv"
-        assert package_file.exists()
-
         package_content = package_file.read_text()
         assert "package parent_pkg" in package_content
         # Check for master address width parameter - array should have a single parameter
         assert "localparam PARENT_CHILDREN_ADDR_WIDTH = 3" in package_content
+
+    def test_validate_writes_no_output(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
+        """Test that validate() checks the design without generating any files."""
+        rdl_source = """
+        addrmap simple_reg {
+            reg {
+                field {
+                    sw=rw;
+                    hw=r;
+                } data[31:0];
+            } my_reg @ 0x0;
+        };
+        """
+        top = compile_rdl(rdl_source, top="simple_reg")
+
+        exporter = BusDecoderExporter()
+        exporter.validate(top, cpuif_cls=APB4Cpuif)
+
+        assert exporter.ds.module_name == "simple_reg"
+        assert not list(tmp_path.glob("*.sv"))
+
+    @pytest.mark.slow
+    def test_templates_compiled_once_per_process(
+        self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second exporter reuses every compiled template, including the cpuif one."""
+        rdl_source = """
+        addrmap simple_reg {
+            reg {
+                field {
+                    sw=rw;
+                    hw=r;
+                } data[31:0];
+            } my_reg @ 0x0;
+        };
+        """
+        top = compile_rdl(rdl_source, top="simple_reg")
+        BusDecoderExporter().export(top, str(tmp_path / "first"), cpuif_cls=APB4Cpuif)
+
+        compiled: list[str] = []
+        original_compile = jj.Environment.compile
+
+        def _compile(env: jj.Environment, source: str, name: str | None = None, *args, **kwargs):
+            compiled.append(name)
+            return original_compile(env, source, name, *args, **kwargs)
+
+        monkeypatch.setattr(jj.Environment, "compile", _compile)
+        BusDecoderExporter().export(top, str(tmp_path / "second"), cpuif_cls=APB4Cpuif)
+
+        assert compiled == []
+        assert (tmp_path / "first" / "simple_reg.sv").read_text() == (
+            tmp_path / "second" / "simple_reg.sv"
+        ).read_text()
+
+    @pytest.mark.slow
+    def test_render_matches_export(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
+        """Test that render() returns exactly what export() writes."""
+        rdl_source = """
+        addrmap simple_reg {
+            reg {
+                field {
+                    sw=rw;
+                    hw=r;
+                } data[31:0];
+            } my_reg @ 0x0;
+        };
+        """
+        top = compile_rdl(rdl_source, top="simple_reg")
+
+        files = BusDecoderExporter().render(top, cpuif_cls=APB4Cpuif)
+        BusDecoderExporter().export(top, str(tmp_path), cpuif_cls=APB4Cpuif)
+
+        assert list(files) == ["simple_reg_pkg.sv", "simple_reg.sv"]
+        for file_name, text in files.items():
+            assert (tmp_path / file_name).read_text() == text
+
+    @pytest.mark.slow
+    def test_export_skips_unchanged_files(
+        self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path
+    ) -> None:
+        """Test that re-exporting leaves identical files untouched and rewrites stale ones."""
+        rdl_source = """
+        addrmap simple_reg {
+            reg {
+                field {
+                    sw=rw;
+                    hw=r;
+                } data[31:0];
+            } my_reg @ 0x0;
+        };
+        """
+        top = compile_rdl(rdl_source, top="simple_reg")
+        module_file = tmp_path / "simple_reg.sv"
+        package_file = tmp_path / "simple_reg_pkg.sv"
+
+        BusDecoderExporter().export(top, str(tmp_path), cpuif_cls=APB4Cpuif)
+        expected = module_file.read_text()
+        package_mtime = package_file.stat().st_mtime_ns
+        module_file.write_text("stale")
+
+        BusDecoderExporter().export(top, str(tmp_path), cpuif_cls=APB4Cpuif)
+
+        assert module_file.read_text() == expected
+        assert package_file.stat().st_mtime_ns == package_mtime
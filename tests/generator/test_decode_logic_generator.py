@@ -84,6 +84,36 @@ class TestDecodeLogicGenerator:
         for pred in predicates:
             assert "cpuif_rd_addr" in pred or ">=" in pred or "<" in pred
 
+    def test_cpuif_addr_predicate_shared_across_flavors(
+        self, compile_rdl: Callable[..., AddrmapNode]
+    ) -> None:
+        """Test that read and write decoders share bounds and differ only in the address signal."""
+        rdl_source = """
+        addrmap test {
+            reg {
+                field {
+                    sw=rw;
+                    hw=r;
+                } data[31:0];
+            } my_reg @ 0x100;
+        };
+        """
+        top = compile_rdl(rdl_source, top="test")
+
+        ds = DesignState(top, {})
+        reg_node = top.get_child_by_name("my_reg")
+        assert reg_node is not None
+
+        bounds = ds.addr_bounds(reg_node, True, ())
+        rd_predicates = DecodeLogicGenerator(ds, DecodeLogicFlavor.READ).cpuif_addr_predicate(reg_node)
+        wr_predicates = DecodeLogicGenerator(ds, DecodeLogicFlavor.WRITE).cpuif_addr_predicate(reg_node)
+        # Both decoders reuse the memoized bounds rather than recomputing them
+        assert ds.addr_bounds(reg_node, True, ()) is bounds
+        assert bounds == ("9'h100", "9'h104")
+
+        assert rd_predicates == ["cpuif_rd_addr >= 9'h100", "cpuif_rd_addr < 9'h104"]
+        assert wr_predicates == [p.replace("cpuif_rd_addr", "cpuif_wr_addr") for p in rd_predicates]
+
     def test_decode_logic_flavor_enum(self) -> None:
         """Test DecodeLogicFlavor enum values."""
         assert DecodeLogicFlavor.READ.value == "rd"
@@ -3,6 +3,19 @@ from collections.abc import Callable
 from systemrdl.node import AddrmapNode
 
 from peakrdl_busdecoder.design_state import DesignState
+from peakrdl_busdecoder.utils import get_indexed_path
+
+# Shared by the option tests below; compile_rdl elaborates it once per session.
+_SIMPLE_REG_RDL = """
+addrmap test {
+    reg {
+        field {
+            sw=rw;
+            hw=r;
+        } data[31:0];
+    } my_reg @ 0x0;
+};
+"""
 
 
 class TestDesignState:
@@ -10,17 +23,7 @@ class TestDesignState:
 
     def test_design_state_basic(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Test basic DesignState initialization."""
-        rdl_source = """
-        addrmap test {
-            reg {
-                field {
-                    sw=rw;
-                    hw=r;
-                } data[31:0];
-            } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="test")
+        top = compile_rdl(_SIMPLE_REG_RDL, top="test")
 
         ds = DesignState(top, {})
 
@@ -32,17 +35,7 @@ class TestDesignState:
 
     def test_design_state_custom_module_name(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Test DesignState with custom module name."""
-        rdl_source = """
-        addrmap test {
-            reg {
-                field {
-                    sw=rw;
-                    hw=r;
-                } data[31:0];
-            } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="test")
+        top = compile_rdl(_SIMPLE_REG_RDL, top="test")
 
         ds = DesignState(top, {"module_name": "custom_module"})
 
@@ -51,17 +44,7 @@ class TestDesignState:
 
     def test_design_state_custom_package_name(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Test DesignState with custom package name."""
-        rdl_source = """
-        addrmap test {
-            reg {
-                field {
-                    sw=rw;
-                    hw=r;
-                } data[31:0];
-            } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="test")
+        top = compile_rdl(_SIMPLE_REG_RDL, top="test")
 
         ds = DesignState(top, {"package_name": "custom_pkg"})
 
@@ -69,17 +52,7 @@ class TestDesignState:
 
     def test_design_state_custom_address_width(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Test DesignState with custom address width."""
-        rdl_source = """
-        addrmap test {
-            reg {
-                field {
-                    sw=rw;
-                    hw=r;
-                } data[31:0];
-            } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="test")
+        top = compile_rdl(_SIMPLE_REG_RDL, top="test")
 
         ds = DesignState(top, {"address_width": 16})
 
@@ -162,3 +135,57 @@ class TestDesignState:
         ds = DesignState(top, {})
 
         assert ds.cpuif_data_width == 128
+
+    def test_is_decode_boundary_matches_boundary_nodes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+        """Test that is_decode_boundary agrees with the boundary node list, rolled and unrolled."""
+        rdl_source = """
+        addrmap blk_t {
+            reg {
+                field { sw=rw; hw=r; } data[31:0];
+            } r0 @ 0x0;
+        };
+        addrmap test {
+            blk_t blk[2] @ 0x0 += 0x100;
+            reg {
+                field { sw=rw; hw=r; } data[31:0];
+            } top_reg @ 0x1000;
+        };
+        """
+        top = compile_rdl(rdl_source, top="test")
+
+        ds = DesignState(top, {"max_decode_depth": 0})
+
+        for unroll in (False, True):
+            for node in ds.get_addressable_children_at_depth(unroll=unroll):
+                assert ds.is_decode_boundary(node)
+                assert not ds.is_decode_boundary(node.parent)
+
+        blk = top.get_child_by_name("blk")
+        assert not ds.is_decode_boundary(blk)
+        assert all(not ds.is_decode_boundary(element) for element in blk.unrolled())
+
+    def test_indexed_path_matches_get_indexed_path(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+        """Test that the memoized indexed_path agrees with get_indexed_path, rolled and unrolled."""
+        rdl_source = """
+        addrmap blk_t {
+            reg {
+                field { sw=rw; hw=r; } data[31:0];
+            } r0[2] @ 0x0 += 0x4;
+        };
+        addrmap test {
+            blk_t blk[2] @ 0x0 += 0x100;
+        };
+        """
+        top = compile_rdl(rdl_source, top="test")
+
+        ds = DesignState(top, {"max_decode_depth": 0})
+
+        rolled = ds.get_addressable_children_at_depth(unroll=False)
+        unrolled = ds.get_addressable_children_at_depth(unroll=True)
+        assert [ds.indexed_path(node, "gi") for node in rolled] == ["blk[gi0].r0[gi1]"]
+        assert ds.indexed_path(unrolled[1]) == "blk[0].r0[1]"
+
+        for node in rolled + unrolled:
+            for indexer, skip_kw_filter in (("i", False), ("gi", True)):
+                expected = get_indexed_path(top, node, indexer, skip_kw_filter)
+                assert ds.indexed_path(node, indexer, skip_kw_filter) == expected
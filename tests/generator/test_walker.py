@@ -0,0 +1,142 @@
+from collections.abc import Callable
+
+import pytest
+from systemrdl.node import AddressableNode, AddrmapNode, Node
+from systemrdl.walker import RDLListener, RDLSteerableWalker, WalkerAction
+
+from peakrdl_busdecoder.design_state import DesignState
+from peakrdl_busdecoder.listener import BusDecoderListener
+from peakrdl_busdecoder.walker import AddressableWalker
+
+_WALK_RDL = """
+reg my_reg_t {
+    field { sw=rw; hw=r; } data[31:0];
+};
+regfile rf_t {
+    my_reg_t regs[2] @ 0x0;
+};
+addrmap leaf_t {
+    signal { activehigh; } irq;
+    my_reg_t a @ 0x0;
+    rf_t rf @ 0x10;
+};
+addrmap walk_top {
+    leaf_t first @ 0x0;
+    leaf_t skip_me @ 0x100;
+    leaf_t arr[2] @ 0x200 += 0x100;
+};
+"""
+
+_CALLBACK_NAMES = [
+    f"{prefix}_{kind}"
+    for kind in (
+        "Component",
+        "AddressableComponent",
+        "VectorComponent",
+        "Addrmap",
+        "Regfile",
+        "Mem",
+        "Reg",
+        "Field",
+        "Signal",
+    )
+    for prefix in ("enter", "exit")
+]
+
+
+class _RecordingListener(BusDecoderListener):
+    """Records enter/exit events and skips descendants of any node named ``skip_me``."""
+
+    def __init__(self, ds: DesignState) -> None:
+        super().__init__(ds)
+        self.events: list[tuple[str, str]] = []
+
+    def enter_AddressableComponent(self, node: AddressableNode) -> WalkerAction | None:
+        self.events.append(("enter", node.get_path()))
+        return WalkerAction.SkipDescendants if node.inst_name == "skip_me" else WalkerAction.Continue
+
+    def exit_AddressableComponent(self, node: AddressableNode) -> None:
+        self.events.append(("exit", node.get_path()))
+
+
+class _FullRecordingListener(RDLListener):
+    """Records every callback, skips below ``skip_me`` and stops at one chosen event."""
+
+    def __init__(self, stop_at: tuple[str, str] | None) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.stop_at = stop_at
+
+    def _record(self, callback: str, node: Node) -> WalkerAction:
+        event = (callback, node.get_path())
+        self.events.append(event)
+        if event == self.stop_at:
+            return WalkerAction.StopNow
+        if callback == "enter_Addrmap" and node.inst_name == "skip_me":
+            return WalkerAction.SkipDescendants
+        return WalkerAction.Continue
+
+
+def _make_callback(name: str) -> Callable[[_FullRecordingListener, Node], WalkerAction]:
+    def callback(self: _FullRecordingListener, node: Node) -> WalkerAction:
+        return self._record(name, node)
+
+    return callback
+
+
+for _name in _CALLBACK_NAMES:
+    setattr(_FullRecordingListener, _name, _make_callback(_name))
+
+
+class TestAddressableWalker:
+    """Test the iterative AddressableWalker against systemrdl's steerable walker."""
+
+    @pytest.mark.parametrize("unroll", [False, True])
+    def test_matches_steerable_walker(self, compile_rdl: Callable[..., AddrmapNode], unroll: bool) -> None:
+        """Event order and SkipDescendants handling match RDLSteerableWalker."""
+        top = compile_rdl(_WALK_RDL, top="walk_top")
+        ds = DesignState(top, {})
+
+        expected = _RecordingListener(ds)
+        RDLSteerableWalker(unroll=unroll).walk(top, expected, skip_top=True)
+        actual = _RecordingListener(ds)
+        AddressableWalker(unroll=unroll).walk(top, actual, skip_top=True)
+
+        assert actual.events == expected.events
+        assert ("enter", "walk_top.skip_me") in actual.events
+        assert not any(path.startswith("walk_top.skip_me.") for _, path in actual.events)
+
+    @pytest.mark.parametrize("unroll", [False, True])
+    @pytest.mark.parametrize(
+        "stop_at",
+        [
+            # Full walk: every callback, including fields and signals
+            pytest.param(None, id="no-stop"),
+            # StopNow from the first callback of a node
+            pytest.param(("enter_Component", "walk_top.first.rf"), id="enter-component"),
+            # StopNow from a type-specific callback
+            pytest.param(("enter_Reg", "walk_top.first.a"), id="enter-reg"),
+            # StopNow from a field, in the middle of a register
+            pytest.param(("enter_Field", "walk_top.first.a.data"), id="enter-field"),
+            # StopNow while unwinding
+            pytest.param(("exit_Addrmap", "walk_top.first"), id="exit-addrmap"),
+        ],
+    )
+    def test_full_callbacks_match_steerable_walker(
+        self,
+        compile_rdl: Callable[..., AddrmapNode],
+        unroll: bool,
+        stop_at: tuple[str, str] | None,
+    ) -> None:
+        """Type-specific callbacks, vector nodes and StopNow match RDLSteerableWalker."""
+        top = compile_rdl(_WALK_RDL, top="walk_top")
+
+        expected = _FullRecordingListener(stop_at)
+        RDLSteerableWalker(unroll=unroll).walk(top, expected, skip_top=True)
+        actual = _FullRecordingListener(stop_at)
+        AddressableWalker(unroll=unroll).walk(top, actual, skip_top=True)
+
+        assert actual.events == expected.events
+        if stop_at is None:
+            assert ("enter_Signal", "walk_top.first.irq") in actual.events
+        else:
+            assert actual.events[-1] == stop_at
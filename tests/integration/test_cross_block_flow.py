@@ -44,6 +44,8 @@ from .helpers import (
     top_level_blocks,
 )
 
+pytestmark = pytest.mark.slow
+
 # A heterogeneous SoC-style map: an arrayed external block, a scalar external
 # block, a plain register, and an external memory — with gaps between them.
 SOC_RDL = """
@@ -28,6 +28,8 @@ from .helpers import (
     route,
 )
 
+pytestmark = pytest.mark.slow
+
 GRID_RDL = """
 addrmap tile {
     reg { field { sw=rw; hw=r; } d[31:0]; } r0 @ 0x0;
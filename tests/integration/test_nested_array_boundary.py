@@ -36,6 +36,8 @@ from .helpers import (
     route,
 )
 
+pytestmark = pytest.mark.slow
+
 # repro 1 (#56): a 1D array of registers under a 1D array of blocks.
 NESTED_1D_RDL = """
 addrmap top {
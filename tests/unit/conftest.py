@@ -5,8 +5,11 @@ from collections.abc import Callable
 import pytest
 from systemrdl.node import AddrmapNode
 
+from peakrdl_busdecoder import BusDecoderExporter
+from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def external_nested_rdl(compile_rdl: Callable[..., AddrmapNode]) -> AddrmapNode:
     """Create an RDL design with external nested addressable components.
 
@@ -41,6 +44,14 @@ def external_nested_rdl(compile_rdl: Callable[..., AddrmapNode]) -> AddrmapNode:
     return compile_rdl(rdl_source, top="buffer_t")
 
 
+@pytest.fixture(scope="session")
+def external_nested_sv(external_nested_rdl: AddrmapNode, tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Generated APB4 module for ``external_nested_rdl``, exported once per session."""
+    output_dir = tmp_path_factory.mktemp("external_nested")
+    BusDecoderExporter().export(external_nested_rdl, str(output_dir), cpuif_cls=APB4Cpuif)
+    return (output_dir / "buffer_t.sv").read_text()
+
+
 @pytest.fixture
 def nested_addrmap_rdl(compile_rdl: Callable[..., AddrmapNode]) -> AddrmapNode:
     """Create an RDL design with nested non-external addrmaps for testing depth control."""
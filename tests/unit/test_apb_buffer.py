@@ -1,8 +1,7 @@
 """Tests for the apb_buffer exporter option."""
 
+import re
 from collections.abc import Callable
-from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 from systemrdl.node import AddrmapNode
@@ -13,11 +12,16 @@ from peakrdl_busdecoder.cpuif.apb3 import APB3Cpuif, APB3CpuifFlat
 from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif, APB4CpuifFlat
 from peakrdl_busdecoder.cpuif.axi4lite import AXI4LiteCpuif
 
+pytestmark = pytest.mark.slow
+
+# Buffered APB signal names, captured without their direction prefix
+_APB_IN_SIGNAL = re.compile(r"\bapb_in_(P[A-Z]+)\b")
+_APB_OUT_SIGNAL = re.compile(r"\bapb_out_(P[A-Z]+)\b")
+
 
 def _export_and_read(top: AddrmapNode, *, cpuif_cls: type[BaseCpuif], **kwargs) -> str:
-    with TemporaryDirectory() as tmpdir:
-        BusDecoderExporter().export(top, tmpdir, cpuif_cls=cpuif_cls, **kwargs)
-        return (Path(tmpdir) / f"{top.inst_name}.sv").read_text()
+    files = BusDecoderExporter().render(top, cpuif_cls=cpuif_cls, **kwargs)
+    return files[f"{top.inst_name}.sv"]
 
 
 @pytest.fixture
@@ -50,8 +54,15 @@ def test_default_no_buffer_signals(simple_top: AddrmapNode, cpuif_cls: type[Base
 def test_buffer_in_apb4_flat(simple_top: AddrmapNode) -> None:
     content = _export_and_read(simple_top, cpuif_cls=APB4CpuifFlat, apb_buffer="in", clk_src="design")
     # Input wire declarations
-    for sig in ("PSEL", "PENABLE", "PWRITE", "PADDR", "PWDATA", "PPROT", "PSTRB"):
-        assert f"apb_in_{sig}" in content
+    assert set(_APB_IN_SIGNAL.findall(content)) >= {
+        "PSEL",
+        "PENABLE",
+        "PWRITE",
+        "PADDR",
+        "PWDATA",
+        "PPROT",
+        "PSTRB",
+    }
     # Flop block reads from slave port
     assert "apb_in_PSEL <= s_apb_PSEL;" in content
     assert "apb_in_PADDR <= s_apb_PADDR;" in content
@@ -66,9 +77,9 @@ def test_buffer_in_apb4_flat(simple_top: AddrmapNode) -> None:
 def test_buffer_in_apb3_omits_pprot_pstrb(simple_top: AddrmapNode) -> None:
     """APB3 has no PPROT/PSTRB, so the buffer must skip them too."""
     content = _export_and_read(simple_top, cpuif_cls=APB3CpuifFlat, apb_buffer="in", clk_src="design")
-    assert "apb_in_PSEL" in content
-    assert "apb_in_PPROT" not in content
-    assert "apb_in_PSTRB" not in content
+    buffered = set(_APB_IN_SIGNAL.findall(content))
+    assert "PSEL" in buffered
+    assert buffered.isdisjoint({"PPROT", "PSTRB"})
 
 
 # ---------------------------------------------------------------------------
@@ -77,8 +88,8 @@ def test_buffer_in_apb3_omits_pprot_pstrb(simple_top: AddrmapNode) -> None:
 def test_buffer_out_apb4_flat(simple_top: AddrmapNode) -> None:
     content = _export_and_read(simple_top, cpuif_cls=APB4CpuifFlat, apb_buffer="out", clk_src="design")
     # Output wire declarations and flop block write to slave port
+    assert set(_APB_OUT_SIGNAL.findall(content)) >= {"PRDATA", "PREADY", "PSLVERR"}
     for sig in ("PRDATA", "PREADY", "PSLVERR"):
-        assert f"apb_out_{sig}" in content
         assert f"s_apb_{sig} <= apb_out_{sig};" in content
     # Cpuif logic writes to buffered signal
     assert "assign apb_out_PRDATA = cpuif_rd_data;" in content
@@ -3,7 +3,6 @@
 import re
 from collections.abc import Callable
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 from systemrdl.node import AddrmapNode
@@ -16,9 +15,8 @@ from peakrdl_busdecoder.cpuif.axi4lite import AXI4LiteCpuif, AXI4LiteCpuifFlat
 
 
 def _export_and_read(top: AddrmapNode, *, cpuif_cls: type[BaseCpuif], **kwargs) -> str:
-    with TemporaryDirectory() as tmpdir:
-        BusDecoderExporter().export(top, tmpdir, cpuif_cls=cpuif_cls, **kwargs)
-        return (Path(tmpdir) / f"{top.inst_name}.sv").read_text()
+    files = BusDecoderExporter().render(top, cpuif_cls=cpuif_cls, **kwargs)
+    return files[f"{top.inst_name}.sv"]
 
 
 @pytest.fixture
@@ -41,6 +39,7 @@ def simple_top(compile_rdl: Callable[..., AddrmapNode]) -> AddrmapNode:
 # clk_src=off (default): no clk/reset at all -- no bus clk/reset bundled and
 # no top-level clk/rst ports (the decoder is purely combinational)
 # ---------------------------------------------------------------------------
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls,clk_signal,reset_signal",
     [
@@ -58,6 +57,7 @@ def test_off_default_drops_bus_clk_reset(
         assert f"{prefix}{reset_signal}" not in content
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls", [APB3CpuifFlat, APB4CpuifFlat, AXI4LiteCpuifFlat, APB3Cpuif, APB4Cpuif, AXI4LiteCpuif]
 )
@@ -73,6 +73,7 @@ def test_off_default_omits_top_level_clk_rst_ports(
 # clk_src=design: top-level clk/rst ports added, no bus clk/reset bundled
 # and nothing fanned out to the masters
 # ---------------------------------------------------------------------------
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls", [APB3CpuifFlat, APB4CpuifFlat, AXI4LiteCpuifFlat, APB3Cpuif, APB4Cpuif, AXI4LiteCpuif]
 )
@@ -84,6 +85,7 @@ def test_design_adds_top_level_clk_rst_ports(
     assert "input  logic rst" in content
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls,clk_signal,reset_signal",
     [
@@ -104,6 +106,7 @@ def test_design_drops_bus_clk_reset(
 # ---------------------------------------------------------------------------
 # clk_src=cpuif: bus carries protocol clk/reset on slave + master, no top-level
 # ---------------------------------------------------------------------------
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls,slave_prefix,clk,rst",
     [
@@ -124,6 +127,7 @@ def test_if_adds_bus_clk_reset_on_slave(
     assert f"{slave_prefix}{rst}" in content
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls,master_prefix,clk,rst",
     [
@@ -167,6 +171,7 @@ def test_master_modport_drives_clk_reset(intf_file: str, clk: str, rst: str) ->
     assert re.search(rf"output\s+{rst}\b", master)
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "cpuif_cls", [APB3CpuifFlat, APB4CpuifFlat, AXI4LiteCpuifFlat, APB3Cpuif, APB4Cpuif, AXI4LiteCpuif]
 )
@@ -183,6 +188,7 @@ def test_if_omits_top_level_clk_rst_ports(
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
+@pytest.mark.slow
 def test_invalid_clk_src_rejected(simple_top: AddrmapNode) -> None:
     with pytest.raises(Exception):  # systemrdl raises a fatal compile error
         _export_and_read(simple_top, cpuif_cls=APB4Cpuif, clk_src="bogus")
@@ -4,30 +4,73 @@ These tests exercise conditions that should be rejected or produce warnings:
 malformed inputs, unsupported configurations, alignment violations, etc.
 """
 
+import re
 from collections.abc import Callable
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 from systemrdl import RDLCompileError
-from systemrdl.node import AddrmapNode
+from systemrdl.node import AddrmapNode, RootNode
 
 from peakrdl_busdecoder import BusDecoderExporter
+from peakrdl_busdecoder.body import Body, IfBody
+from peakrdl_busdecoder.cpuif import BaseCpuif
 from peakrdl_busdecoder.cpuif.apb3 import APB3Cpuif
 from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif
+from peakrdl_busdecoder.cpuif.axi4lite import AXI4LiteCpuif
 from peakrdl_busdecoder.design_state import DesignState
 
+# Expected error messages, shared by every test class that checks for them
+_UNABLE_TO_EXPORT = re.compile(r"Unable to export")
+_ADDRESS_WIDTH = re.compile(r"address width")
+_UNEXPECTED_KWARG = re.compile(r"unexpected keyword argument")
+_BRANCH_AFTER_ELSE = re.compile(r"Cannot add branches after")
+
+# CPU interfaces by their command-line names, for indirect parametrization
+_CPUIFS: dict[str, type[BaseCpuif]] = {
+    "apb3": APB3Cpuif,
+    "apb4": APB4Cpuif,
+    "axi4-lite": AXI4LiteCpuif,
+}
+
+# The canonical single-register design, shared by every test that needs nothing more
+_SINGLE_REG_AT_ZERO_RDL = """
+addrmap test {
+    reg my_reg_t {
+        field { sw=rw; hw=r; } data[31:0];
+    };
+    my_reg_t my_reg @ 0x0;
+};
+"""
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
 def _export(top: AddrmapNode, **kwargs) -> None:
-    """Export via APB4 into a throwaway directory; raises on validation errors."""
+    """Render via APB4 in memory, discarding the output; raises on validation errors."""
     cpuif_cls = kwargs.pop("cpuif_cls", APB4Cpuif)
-    with TemporaryDirectory() as tmpdir:
-        exporter = BusDecoderExporter()
-        exporter.export(top, tmpdir, cpuif_cls=cpuif_cls, **kwargs)
+    exporter = BusDecoderExporter()
+    exporter.render(top, cpuif_cls=cpuif_cls, **kwargs)
+
+
+def _validate(top: AddrmapNode, **kwargs) -> None:
+    """Run the exporter's design checks via APB4 without writing any output."""
+    cpuif_cls = kwargs.pop("cpuif_cls", APB4Cpuif)
+    exporter = BusDecoderExporter()
+    exporter.validate(top, cpuif_cls=cpuif_cls, **kwargs)
+
+
+@pytest.fixture
+def cpuif_cls(request: pytest.FixtureRequest) -> type[BaseCpuif]:
+    """Resolve an indirectly parametrized CPU interface name to its class."""
+    return _CPUIFS[request.param]
+
+
+@pytest.fixture(scope="module")
+def simple_top(compile_rdl: Callable[..., AddrmapNode]) -> AddrmapNode:
+    return compile_rdl(_SINGLE_REG_AT_ZERO_RDL, top="test")
 
 
 # ===========================================================================
@@ -48,8 +91,8 @@ class TestUnalignedRegisters:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
     def test_unaligned_offset_odd_byte(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """A register at offset 0x1 must fail alignment check."""
@@ -69,7 +112,7 @@ class TestUnalignedRegisters:
         except RDLCompileError:
             pytest.skip("RDL compiler rejected overlapping registers")
         with pytest.raises(RDLCompileError):
-            _export(top)
+            _validate(top)
 
     def test_unaligned_offset_half_word(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """A register at offset 0x2 (half-word aligned but not word-aligned) must fail."""
@@ -83,9 +126,10 @@ class TestUnalignedRegisters:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
+    @pytest.mark.slow
     def test_aligned_offset_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Properly word-aligned offsets should pass validation."""
         rdl = """
@@ -119,8 +163,8 @@ class TestUnalignedArrayStride:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
     def test_unaligned_stride_6_rejected(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """An array stride of 0x6 (not a multiple of 4) must fail."""
@@ -133,9 +177,10 @@ class TestUnalignedArrayStride:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
+    @pytest.mark.slow
     def test_aligned_stride_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """A stride that is a multiple of 4 bytes should pass."""
         rdl = """
@@ -163,8 +208,8 @@ class TestUnalignedArrayStride:
         """
         # stride = 12 but data_width_bytes = 8
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
 
 # ===========================================================================
@@ -193,9 +238,10 @@ class TestMultiWordRegisterMismatch:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
+    @pytest.mark.slow
     def test_consistent_accesswidth_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """A wide register whose accesswidth matches the bus width should pass."""
         rdl = """
@@ -214,6 +260,7 @@ class TestMultiWordRegisterMismatch:
         top = compile_rdl(rdl, top="test")
         _export(top)  # Should not raise
 
+    @pytest.mark.slow
     def test_all_wide_same_accesswidth_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """Multiple wide registers with matching accesswidth should pass."""
         rdl = """
@@ -250,8 +297,8 @@ class TestSharedExtBus:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
     def test_sharedextbus_on_child_addrmap_rejected(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """A child addrmap with sharedextbus (that is not external) must fail."""
@@ -271,9 +318,10 @@ class TestSharedExtBus:
         # its internals. But the sharedextbus check fires on enter_Addrmap,
         # which happens before SkipDescendants.
         top = compile_rdl(rdl, top="outer")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top)
 
+    @pytest.mark.slow
     def test_no_sharedextbus_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """An addrmap without sharedextbus should pass."""
         rdl = """
@@ -306,7 +354,7 @@ class TestAddressWidthTooSmall:
         };
         """
         top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="address width"):
+        with pytest.raises(RDLCompileError, match=_ADDRESS_WIDTH):
             DesignState(top, {"address_width": 1})
 
     def test_address_width_too_small_by_one(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
@@ -324,7 +372,7 @@ class TestAddressWidthTooSmall:
         ds = DesignState(top, {})
         min_width = ds.addr_width
 
-        with pytest.raises(RDLCompileError, match="address width"):
+        with pytest.raises(RDLCompileError, match=_ADDRESS_WIDTH):
             DesignState(top, {"address_width": min_width - 1})
 
     def test_address_width_exact_minimum_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
@@ -381,6 +429,7 @@ class TestExternalOnlyDesign:
         ds = DesignState(top, {})
         assert ds.cpuif_data_width == 32
 
+    @pytest.mark.slow
     def test_external_only_still_exports(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """An external-only design should still export successfully."""
         rdl = """
@@ -404,10 +453,11 @@ class TestExporterStrayKwargs:
 
     def test_constructor_stray_kwarg(self) -> None:
         """BusDecoderExporter() with unknown kwargs must raise TypeError."""
-        with pytest.raises(TypeError, match="unexpected keyword argument"):
+        with pytest.raises(TypeError, match=_UNEXPECTED_KWARG):
             BusDecoderExporter(bad_option=True)
 
-    def test_export_stray_kwarg(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+    @pytest.mark.slow
+    def test_export_stray_kwarg(self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path) -> None:
         """export() with unknown kwargs must raise TypeError."""
         rdl = """
         addrmap test {
@@ -419,16 +469,18 @@ class TestExporterStrayKwargs:
         """
         top = compile_rdl(rdl, top="test")
         exporter = BusDecoderExporter()
-        with TemporaryDirectory() as tmpdir:
-            with pytest.raises(TypeError, match="unexpected keyword argument"):
-                exporter.export(top, tmpdir, bogus_option=42)
+        with pytest.raises(TypeError, match=_UNEXPECTED_KWARG):
+            exporter.export(top, str(tmp_path), bogus_option=42)
 
     def test_constructor_multiple_stray_kwargs(self) -> None:
         """Multiple stray kwargs should still raise TypeError (reports the first)."""
-        with pytest.raises(TypeError, match="unexpected keyword argument"):
+        with pytest.raises(TypeError, match=_UNEXPECTED_KWARG):
             BusDecoderExporter(foo="bar", baz=123)
 
-    def test_export_stray_kwarg_alongside_valid(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+    @pytest.mark.slow
+    def test_export_stray_kwarg_alongside_valid(
+        self, compile_rdl: Callable[..., AddrmapNode], tmp_path: Path
+    ) -> None:
         """A mix of valid and invalid kwargs must raise TypeError for the invalid one."""
         rdl = """
         addrmap test {
@@ -440,9 +492,8 @@ class TestExporterStrayKwargs:
         """
         top = compile_rdl(rdl, top="test")
         exporter = BusDecoderExporter()
-        with TemporaryDirectory() as tmpdir:
-            with pytest.raises(TypeError, match="unexpected keyword argument"):
-                exporter.export(top, tmpdir, cpuif_cls=APB4Cpuif, not_a_real_option=True)
+        with pytest.raises(TypeError, match=_UNEXPECTED_KWARG):
+            exporter.export(top, str(tmp_path), cpuif_cls=APB4Cpuif, not_a_real_option=True)
 
 
 # ===========================================================================
@@ -453,38 +504,30 @@ class TestIfBodyStateErrors:
 
     def test_branch_after_else_raises(self) -> None:
         """Adding a conditional branch after an else must fail."""
-        from peakrdl_busdecoder.body import IfBody
-
         body = IfBody()
         body["condition1"]  # if
         body[None]  # else
-        with pytest.raises(RuntimeError, match="Cannot add branches after"):
+        with pytest.raises(RuntimeError, match=_BRANCH_AFTER_ELSE):
             body["condition2"]
 
     def test_double_else_raises(self) -> None:
         """Adding two else branches must fail."""
-        from peakrdl_busdecoder.body import IfBody
-
         body = IfBody()
         body["condition1"]  # if
         body[None]  # else
-        with pytest.raises(RuntimeError, match="Cannot add branches after"):
+        with pytest.raises(RuntimeError, match=_BRANCH_AFTER_ELSE):
             body[None]
 
     def test_ior_conditional_after_else_raises(self) -> None:
         """Using |= to add a conditional branch after else must fail."""
-        from peakrdl_busdecoder.body import Body, IfBody
-
         ifb = IfBody()
         ifb["cond1"]
         ifb[None]  # else
-        with pytest.raises(RuntimeError, match="Cannot add branches after"):
+        with pytest.raises(RuntimeError, match=_BRANCH_AFTER_ELSE):
             ifb |= ("cond2", Body())
 
     def test_ior_else_after_else_raises(self) -> None:
         """Using |= to add a Body (else) after else must fail."""
-        from peakrdl_busdecoder.body import Body, IfBody
-
         ifb = IfBody()
         ifb["cond1"]
         ifb[None]  # else
@@ -493,63 +536,127 @@ class TestIfBodyStateErrors:
 
     def test_cm_after_else_raises(self) -> None:
         """Using the context manager to add a branch after else must fail."""
-        from peakrdl_busdecoder.body import IfBody
-
         body = IfBody()
         with body.cm("cond1"):
             pass
         with body.cm(None):  # else
             pass
-        with pytest.raises(RuntimeError, match="Cannot add branches after"):
+        with pytest.raises(RuntimeError, match=_BRANCH_AFTER_ELSE):
             with body.cm("cond2"):
                 pass
 
     def test_ellipsis_as_else(self) -> None:
         """Using Ellipsis (...) as the condition should produce an else branch."""
-        from peakrdl_busdecoder.body import IfBody
-
         body = IfBody()
         body["cond1"]
         body[...]  # else via Ellipsis
-        with pytest.raises(RuntimeError, match="Cannot add branches after"):
+        with pytest.raises(RuntimeError, match=_BRANCH_AFTER_ELSE):
             body["cond2"]
 
 
+# ===========================================================================
+# Shared sources for the table-driven alignment / protocol tests
+# ===========================================================================
+_UNALIGNED_RDL = """
+addrmap test {
+    reg my_reg_t {
+        field { sw=rw; hw=r; } data[31:0];
+    };
+    my_reg_t reg_a @ 0x0;
+    my_reg_t reg_b @ 0x5;
+};
+"""
+
+_SHAREDEXTBUS_RDL = """
+addrmap test {
+    sharedextbus;
+    reg my_reg_t {
+        field { sw=rw; hw=r; } data[31:0];
+    };
+    my_reg_t my_reg @ 0x0;
+};
+"""
+
+_LARGE_ALIGNED_OFFSET_RDL = """
+addrmap test {
+    reg my_reg_t {
+        field { sw=rw; hw=r; } data[31:0];
+    };
+    my_reg_t reg_a @ 0x0;
+    my_reg_t reg_b @ 0x1000;
+};
+"""
+
+_64BIT_ALIGNED_RDL = """
+addrmap test {
+    reg wide_reg_t {
+        regwidth = 64;
+        accesswidth = 64;
+        field { sw=rw; hw=r; } data[63:0];
+    };
+    wide_reg_t reg_a @ 0x0;
+    wide_reg_t reg_b @ 0x8;
+};
+"""
+
+_64BIT_UNALIGNED_RDL = """
+addrmap test {
+    reg wide_reg_t {
+        regwidth = 64;
+        accesswidth = 64;
+        field { sw=rw; hw=r; } data[63:0];
+    };
+    wide_reg_t reg_a @ 0x0;
+    wide_reg_t reg_b @ 0xC;
+};
+"""
+
+_MULTIPLE_UNALIGNED_RDL = """
+addrmap test {
+    reg my_reg_t {
+        field { sw=rw; hw=r; } data[31:0];
+    };
+    my_reg_t reg_a @ 0x0;
+    my_reg_t reg_b @ 0x5;
+    my_reg_t reg_c @ 0x9;
+};
+"""
+
+
+def _check_export(top: AddrmapNode, cpuif_cls: type[BaseCpuif], fails: bool) -> None:
+    """Export ``top``, asserting that validation rejects it when ``fails`` is set."""
+    if fails:
+        with pytest.raises(RDLCompileError, match=_UNABLE_TO_EXPORT):
+            _validate(top, cpuif_cls=cpuif_cls)
+    else:
+        _export(top, cpuif_cls=cpuif_cls)
+
+
 # ===========================================================================
 # 9. Multiple CPU interface protocols
 # ===========================================================================
 class TestMultipleCpuifProtocols:
     """Verify that error paths trigger consistently across different cpuif classes."""
 
-    def test_unaligned_rejected_apb3(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """Unaligned registers should be rejected under APB3 as well."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t reg_a @ 0x0;
-            my_reg_t reg_b @ 0x5;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top, cpuif_cls=APB3Cpuif)
-
-    def test_sharedextbus_rejected_apb3(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """sharedextbus should be rejected under APB3."""
-        rdl = """
-        addrmap test {
-            sharedextbus;
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top, cpuif_cls=APB3Cpuif)
+    @pytest.mark.parametrize("cpuif_cls", ["apb3", "apb4", "axi4-lite"], indirect=True)
+    @pytest.mark.parametrize(
+        "rdl, fails",
+        [
+            pytest.param(_UNALIGNED_RDL, True, id="unaligned"),
+            pytest.param(_SHAREDEXTBUS_RDL, True, id="sharedextbus"),
+            pytest.param(_SINGLE_REG_AT_ZERO_RDL, False, id="aligned", marks=pytest.mark.slow),
+        ],
+    )
+    def test_protocol_rejection(
+        self,
+        compile_rdl: Callable[..., AddrmapNode],
+        rdl: str,
+        cpuif_cls: type[BaseCpuif],
+        fails: bool,
+    ) -> None:
+        """Unsupported designs are rejected regardless of the CPU interface."""
+        top = compile_rdl(rdl, top="test")
+        _check_export(top, cpuif_cls, fails)
 
 
 # ===========================================================================
@@ -558,81 +665,27 @@ class TestMultipleCpuifProtocols:
 class TestEdgeCaseAlignments:
     """Boundary conditions and edge cases for alignment validation."""
 
-    def test_single_register_at_zero_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """A single register at offset 0 is always aligned."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        _export(top)
-
-    def test_large_aligned_offset_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """A register at a large but properly aligned offset should pass."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t reg_a @ 0x0;
-            my_reg_t reg_b @ 0x1000;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        _export(top)
-
-    def test_64bit_bus_alignment(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """On a 64-bit bus, offset 0xC (only 4-byte aligned, not 8) must fail."""
-        rdl = """
-        addrmap test {
-            reg wide_reg_t {
-                regwidth = 64;
-                accesswidth = 64;
-                field { sw=rw; hw=r; } data[63:0];
-            };
-            wide_reg_t reg_a @ 0x0;
-            wide_reg_t reg_b @ 0xC;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
-
-    def test_64bit_bus_proper_alignment_passes(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """On a 64-bit bus, offset 0x8 (8-byte aligned) should pass."""
-        rdl = """
-        addrmap test {
-            reg wide_reg_t {
-                regwidth = 64;
-                accesswidth = 64;
-                field { sw=rw; hw=r; } data[63:0];
-            };
-            wide_reg_t reg_a @ 0x0;
-            wide_reg_t reg_b @ 0x8;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        _export(top)
-
-    def test_multiple_alignment_errors_still_fatal(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """Multiple unaligned registers should all be reported, then a fatal is raised."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t reg_a @ 0x0;
-            my_reg_t reg_b @ 0x5;
-            my_reg_t reg_c @ 0x9;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        with pytest.raises(RDLCompileError, match="Unable to export"):
-            _export(top)
+    @pytest.mark.parametrize(
+        "rdl, fails",
+        [
+            # A single register at offset 0 is always aligned
+            pytest.param(
+                _SINGLE_REG_AT_ZERO_RDL, False, id="single-register-at-zero", marks=pytest.mark.slow
+            ),
+            # A register at a large but properly aligned offset
+            pytest.param(_LARGE_ALIGNED_OFFSET_RDL, False, id="large-aligned-offset", marks=pytest.mark.slow),
+            # On a 64-bit bus, offset 0x8 is 8-byte aligned
+            pytest.param(_64BIT_ALIGNED_RDL, False, id="64bit-bus-aligned", marks=pytest.mark.slow),
+            # On a 64-bit bus, offset 0xC is only 4-byte aligned, not 8
+            pytest.param(_64BIT_UNALIGNED_RDL, True, id="64bit-bus-unaligned"),
+            # Multiple unaligned registers are all reported, then a fatal is raised
+            pytest.param(_MULTIPLE_UNALIGNED_RDL, True, id="multiple-unaligned"),
+        ],
+    )
+    def test_alignment(self, compile_rdl: Callable[..., AddrmapNode], rdl: str, fails: bool) -> None:
+        """Aligned designs export; any misalignment is fatal."""
+        top = compile_rdl(rdl, top="test")
+        _check_export(top, APB4Cpuif, fails)
 
 
 # ===========================================================================
@@ -678,92 +731,39 @@ class TestDesignStateEdgeCases:
         assert ds.module_name == "my_custom_name"
         assert ds.package_name == "my_custom_name_pkg"
 
-    def test_address_width_zero_design(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+    def test_address_width_zero_design(self, simple_top: AddrmapNode) -> None:
         """A minimal design should still compute a valid address width > 0."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        ds = DesignState(top, {})
+        ds = DesignState(simple_top, {})
         assert ds.addr_width > 0
 
-    def test_max_decode_depth_default(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """Default max_decode_depth should be 1."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        ds = DesignState(top, {})
-        assert ds.max_decode_depth == 1
-
-    def test_max_decode_depth_zero(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """max_decode_depth=0 means decode all levels."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        ds = DesignState(top, {"max_decode_depth": 0})
-        assert ds.max_decode_depth == 0
-
-    def test_reuse_hwif_typedefs_default(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        """Default reuse_hwif_typedefs should be True."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="test")
-        ds = DesignState(top, {})
-        assert ds.reuse_hwif_typedefs is True
+    @pytest.mark.parametrize(
+        "opts, attr, expected",
+        [
+            # Default max_decode_depth should be 1
+            pytest.param({}, "max_decode_depth", 1, id="max-decode-depth-default"),
+            # max_decode_depth=0 means decode all levels
+            pytest.param({"max_decode_depth": 0}, "max_decode_depth", 0, id="max-decode-depth-zero"),
+            # Default reuse_hwif_typedefs should be True
+            pytest.param({}, "reuse_hwif_typedefs", True, id="reuse-hwif-typedefs-default"),
+        ],
+    )
+    def test_option_defaults(self, simple_top: AddrmapNode, opts: dict, attr: str, expected: object) -> None:
+        """DesignState options resolve to their documented values."""
+        assert getattr(DesignState(simple_top, opts), attr) == expected
 
 
 # ===========================================================================
 # 12. RootNode vs AddrmapNode input
 # ===========================================================================
+@pytest.mark.slow
 class TestRootNodeHandling:
     """The exporter should handle both RootNode and AddrmapNode inputs."""
 
-    def test_export_with_root_node(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
+    def test_export_with_root_node(self, simple_top: AddrmapNode, tmp_path: Path) -> None:
         """Passing a RootNode (parent of top addrmap) should still work."""
-        rdl = """
-        addrmap test {
-            reg my_reg_t {
-                field { sw=rw; hw=r; } data[31:0];
-            };
-            my_reg_t my_reg @ 0x0;
-        };
-        """
-        from tempfile import NamedTemporaryFile
-
-        from systemrdl import RDLCompiler
-
-        compiler = RDLCompiler()
-        with NamedTemporaryFile("w", suffix=".rdl", delete=False) as f:
-            f.write(rdl)
-            f.flush()
-            compiler.compile_file(f.name)
-
-        root = compiler.elaborate(top_def_name="test")
+        root = simple_top.parent
+        assert isinstance(root, RootNode)
         # Pass the RootNode directly (not root.top)
-        with TemporaryDirectory() as tmpdir:
-            exporter = BusDecoderExporter()
-            exporter.export(root, tmpdir, cpuif_cls=APB4Cpuif)
-            assert (Path(tmpdir) / "test.sv").exists()
+        exporter = BusDecoderExporter()
+        exporter.export(root, str(tmp_path), cpuif_cls=APB4Cpuif)
+        assert (tmp_path / "test.sv").exists()
@@ -3,12 +3,15 @@
 from collections.abc import Callable
 from pathlib import Path
 
+import pytest
 from systemrdl.node import AddrmapNode
 
 from peakrdl_busdecoder import BusDecoderExporter
 from peakrdl_busdecoder.cpuif.apb3 import APB3CpuifFlat
 from peakrdl_busdecoder.cpuif.apb4 import APB4CpuifFlat
 
+pytestmark = pytest.mark.slow
+
 
 _RDL = """
 addrmap multi_slave {
@@ -1,9 +1,8 @@
 """Test max_decode_depth parameter behavior."""
 
-from collections.abc import Callable
-from pathlib import Path
-from tempfile import TemporaryDirectory
+from collections.abc import Callable, Hashable
 
+import pytest
 from systemrdl.node import AddrmapNode, RegNode
 
 from peakrdl_busdecoder import BusDecoderExporter
@@ -12,45 +11,117 @@ from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif
 from peakrdl_busdecoder.cpuif.axi4lite import AXI4LiteCpuif
 from peakrdl_busdecoder.design_state import DesignState
 
+# Shared RDL sources. Tests that use the same design reference the same text,
+# so the session-scoped compile_rdl cache elaborates each of them only once.
+_LEVEL1_IN_LEVEL0_RDL = """
+addrmap level1 {
+    reg {
+        field { sw=rw; hw=r; } data1[31:0];
+    } reg1 @ 0x0;
+};
+
+addrmap level0 {
+    level1 inner1 @ 0x0;
+};
+"""
+
+_CHILD_BLOCK_RDL = """
+addrmap child {
+    reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
+};
+
+addrmap top {
+    child block @ 0x0;
+};
+"""
+
+_ARRAYED_BLOCKS_RDL = """
+addrmap child {
+    reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
+};
+
+addrmap top {
+    child blocks[4] @ 0x0 += 0x100;
+};
+"""
+
+_ARRAYED_TWO_REG_BLOCKS_RDL = """
+addrmap child {
+    reg {
+        field { sw=rw; hw=r; } data[31:0];
+    } reg1 @ 0x0;
+    reg {
+        field { sw=rw; hw=r; } data[31:0];
+    } reg2 @ 0x4;
+};
+
+addrmap top {
+    child blocks[4] @ 0x0 += 0x100;
+};
+"""
+
+_THREE_LEVEL_RDL = """
+addrmap l2 {
+    reg { field { sw=rw; hw=r; } data[31:0]; } l2_reg @ 0x0;
+};
+addrmap l1 {
+    reg { field { sw=rw; hw=r; } data[31:0]; } l1_reg @ 0x0;
+    l2 sub @ 0x10;
+};
+addrmap top {
+    l1 blk @ 0x0;
+};
+"""
+
+_SINGLE_REG_RDL = """
+addrmap top {
+    reg { field { sw=rw; hw=r; } data[31:0]; } my_reg @ 0x0;
+};
+"""
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def _export_and_read(
-    top: AddrmapNode,
-    *,
-    max_decode_depth: int = 1,
-    cpuif_cls: type = APB4Cpuif,
-    **kwargs,
-) -> str:
-    """Export via given cpuif into a temp dir and return the module .sv content."""
-    with TemporaryDirectory() as tmpdir:
-        exporter = BusDecoderExporter()
-        exporter.export(
-            top, tmpdir, cpuif_cls=cpuif_cls, max_decode_depth=max_decode_depth, **kwargs
-        )
-        module_file = Path(tmpdir) / f"{top.inst_name}.sv"
-        return module_file.read_text()
+@pytest.fixture(scope="module")
+def export_and_read() -> Callable[..., str]:
+    """Return a helper that renders via the given cpuif and returns the module .sv content.
+
+    The sources are rendered in memory, so no export touches the filesystem.
+    Results are memoized per design and export options for the module: tests
+    that render the same configuration share a single export.
+    """
+    # Keyed on id(top); each entry also holds the node itself so the id cannot
+    # be recycled by another design while the entry exists.
+    cache: dict[tuple[Hashable, ...], tuple[AddrmapNode, str]] = {}
+
+    def _export_and_read(
+        top: AddrmapNode,
+        *,
+        max_decode_depth: int = 1,
+        cpuif_cls: type = APB4Cpuif,
+        **kwargs,
+    ) -> str:
+        key = (id(top), max_decode_depth, cpuif_cls, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            exporter = BusDecoderExporter()
+            files = exporter.render(top, cpuif_cls=cpuif_cls, max_decode_depth=max_decode_depth, **kwargs)
+            cache[key] = (top, files[f"{top.inst_name}.sv"])
+        return cache[key][1]
+
+    return _export_and_read
 
 
 # ===========================================================================
 # 1. Basic depth tests (existing coverage, kept for regression)
 # ===========================================================================
-def test_depth_1_generates_top_level_interface_only(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_1_generates_top_level_interface_only(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test that depth=1 generates interface only for top-level children."""
-    rdl_source = """
-    addrmap level1 {
-        reg {
-            field { sw=rw; hw=r; } data1[31:0];
-        } reg1 @ 0x0;
-    };
-
-    addrmap level0 {
-        level1 inner1 @ 0x0;
-    };
-    """
-    top = compile_rdl(rdl_source, top="level0")
-    content = _export_and_read(top, max_decode_depth=1)
+    top = compile_rdl(_LEVEL1_IN_LEVEL0_RDL, top="level0")
+    content = export_and_read(top, max_decode_depth=1)
 
     # Should have interface for inner1 only
     assert "m_apb_inner1" in content
@@ -61,7 +132,10 @@ def test_depth_1_generates_top_level_interface_only(compile_rdl: Callable[..., A
     assert "logic inner1;" in content
 
 
-def test_depth_2_generates_second_level_interfaces(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_2_generates_second_level_interfaces(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test that depth=2 generates interfaces for second-level children."""
     rdl_source = """
     addrmap level2 {
@@ -83,22 +157,24 @@ def test_depth_2_generates_second_level_interfaces(compile_rdl: Callable[..., Ad
     };
     """
     top = compile_rdl(rdl_source, top="level0")
-    content = _export_and_read(top, max_decode_depth=2)
+    content = export_and_read(top, max_decode_depth=2)
 
-    # Should have interfaces for reg1 and inner2
+    # Interfaces for reg1 and inner2
     assert "m_apb_reg1" in content
     assert "m_apb_inner2" in content
-    # Should NOT have interface for inner1 or reg2
-    assert "m_apb_inner1" not in content
-    assert "m_apb_reg2" not in content
-
     # Struct should be hierarchical with inner1.reg1 and inner1.inner2
     assert "cpuif_sel_inner1_t" in content
     assert "logic reg1;" in content
     assert "logic inner2;" in content
+    # No interface for inner1 or reg2
+    assert "m_apb_inner1" not in content
+    assert "m_apb_reg2" not in content
 
 
-def test_depth_0_decodes_all_levels(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_0_decodes_all_levels(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test that depth=0 decodes all the way down to registers."""
     rdl_source = """
     addrmap level2 {
@@ -124,74 +200,60 @@ def test_depth_0_decodes_all_levels(compile_rdl: Callable[..., AddrmapNode]) ->
     };
     """
     top = compile_rdl(rdl_source, top="level0")
-    content = _export_and_read(top, max_decode_depth=0)
+    content = export_and_read(top, max_decode_depth=0)
 
-    # Should have interfaces for all leaf registers
+    # Interfaces for all leaf registers
     assert "m_apb_reg1" in content
     assert "m_apb_reg2" in content
     assert "m_apb_reg2b" in content
-    # Should NOT have interfaces for addrmaps
-    assert "m_apb_inner1" not in content
-    assert "m_apb_inner2" not in content
-
     # Struct should be fully hierarchical
     assert "cpuif_sel_inner1_t" in content
     assert "cpuif_sel_inner2_t" in content
+    # No interfaces for addrmaps
+    assert "m_apb_inner1" not in content
+    assert "m_apb_inner2" not in content
 
 
-def test_depth_affects_decode_logic(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_affects_decode_logic(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test that decode logic changes based on max_decode_depth."""
-    rdl_source = """
-    addrmap level1 {
-        reg {
-            field { sw=rw; hw=r; } data1[31:0];
-        } reg1 @ 0x0;
-    };
-
-    addrmap level0 {
-        level1 inner1 @ 0x0;
-    };
-    """
-    top = compile_rdl(rdl_source, top="level0")
+    top = compile_rdl(_LEVEL1_IN_LEVEL0_RDL, top="level0")
 
     # Test depth=1: should set cpuif_wr_sel.inner1
-    content = _export_and_read(top, max_decode_depth=1)
+    content = export_and_read(top, max_decode_depth=1)
     assert "cpuif_wr_sel.inner1 = 1'b1;" in content
     assert "cpuif_wr_sel.inner1.reg1" not in content
 
     # Test depth=2: should set cpuif_wr_sel.inner1.reg1
-    content = _export_and_read(top, max_decode_depth=2)
+    content = export_and_read(top, max_decode_depth=2)
     assert "cpuif_wr_sel.inner1.reg1 = 1'b1;" in content
     assert "cpuif_wr_sel.inner1 = 1'b1;" not in content
 
 
-def test_depth_affects_fanout_fanin(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_affects_fanout_fanin(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test that fanout/fanin logic changes based on max_decode_depth."""
-    rdl_source = """
-    addrmap level1 {
-        reg {
-            field { sw=rw; hw=r; } data1[31:0];
-        } reg1 @ 0x0;
-    };
-
-    addrmap level0 {
-        level1 inner1 @ 0x0;
-    };
-    """
-    top = compile_rdl(rdl_source, top="level0")
+    top = compile_rdl(_LEVEL1_IN_LEVEL0_RDL, top="level0")
 
     # Test depth=1: should have fanout for inner1
-    content = _export_and_read(top, max_decode_depth=1)
+    content = export_and_read(top, max_decode_depth=1)
     assert "m_apb_inner1.PSEL" in content
     assert "m_apb_reg1.PSEL" not in content
 
     # Test depth=2: should have fanout for reg1
-    content = _export_and_read(top, max_decode_depth=2)
+    content = export_and_read(top, max_decode_depth=2)
     assert "m_apb_reg1.PSEL" in content
     assert "m_apb_inner1.PSEL" not in content
 
 
-def test_depth_3_with_deep_hierarchy(compile_rdl: Callable[..., AddrmapNode]) -> None:
+@pytest.mark.slow
+def test_depth_3_with_deep_hierarchy(
+    compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
+) -> None:
     """Test depth=3 with a 4-level deep hierarchy."""
     rdl_source = """
     addrmap level3 {
@@ -221,17 +283,17 @@ def test_depth_3_with_deep_hierarchy(compile_rdl: Callable[..., AddrmapNode]) ->
     };
     """
     top = compile_rdl(rdl_source, top="level0")
-    content = _export_and_read(top, max_decode_depth=3)
+    content = export_and_read(top, max_decode_depth=3)
 
-    # Should have interfaces at depth 3: reg2, inner3
+    # Interfaces at depth 3: reg2, inner3
     assert "m_apb_reg2" in content
     assert "m_apb_inner3" in content
-    # reg1 is a leaf at depth 2, shallower than the boundary. It is still part
-    # of the address map, so it must keep its interface (previously it was
-    # silently dropped, leaving its addresses unreachable).
+    # reg1 is a leaf at depth 2, shallower than the boundary. It is still
+    # part of the address map, so it must keep its interface (previously
+    # it was silently dropped, leaving its addresses unreachable).
     assert "m_apb_reg1" in content
-    # Should NOT have interfaces for non-leaf blocks above the boundary, nor
-    # for anything below it
+    # No interfaces for non-leaf blocks above the boundary, nor for
+    # anything below it
     assert "m_apb_inner1" not in content
     assert "m_apb_inner2" not in content
     assert "m_apb_reg3" not in content
@@ -240,11 +302,12 @@ def test_depth_3_with_deep_hierarchy(compile_rdl: Callable[..., AddrmapNode]) ->
 # ===========================================================================
 # 2. Multiple siblings at the decode boundary
 # ===========================================================================
+@pytest.mark.slow
 class TestMultipleSiblings:
     """Verify correct generation when multiple children exist at the same depth."""
 
     def test_depth_1_multiple_top_level_children(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with three top-level addrmaps generates three interfaces."""
         rdl_source = """
@@ -261,7 +324,7 @@ class TestMultipleSiblings:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         assert "m_apb_block_a" in content
         assert "m_apb_block_b" in content
@@ -270,7 +333,7 @@ class TestMultipleSiblings:
         assert "m_apb_reg1" not in content
 
     def test_depth_1_mixed_registers_and_addrmaps(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with registers and addrmaps at top level."""
         rdl_source = """
@@ -288,7 +351,7 @@ class TestMultipleSiblings:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Both the register and child addrmap are at depth 1
         assert "m_apb_top_reg" in content
@@ -297,7 +360,7 @@ class TestMultipleSiblings:
         assert "m_apb_inner_reg" not in content
 
     def test_depth_2_multiple_siblings_at_second_level(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 with three children inside a parent addrmap."""
         rdl_source = """
@@ -312,7 +375,7 @@ class TestMultipleSiblings:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # All three registers at depth 2 should have interfaces
         assert "m_apb_reg_a" in content
@@ -325,6 +388,7 @@ class TestMultipleSiblings:
 # ===========================================================================
 # 3. Depth exceeding actual hierarchy
 # ===========================================================================
+@pytest.mark.slow
 class TestDepthExceedsHierarchy:
     """When max_decode_depth is deeper than the hierarchy, the decoder should
     still work correctly. Nodes above the depth boundary are traversed but
@@ -332,23 +396,12 @@ class TestDepthExceedsHierarchy:
     When depth exceeds all hierarchy levels, no child interfaces are generated."""
 
     def test_depth_exceeding_hierarchy_still_exports(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=5 on a 2-level hierarchy should still export without error."""
-        rdl_source = """
-        addrmap child {
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child block @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
         # Should not raise an error
-        content = _export_and_read(top, max_decode_depth=5)
+        content = export_and_read(top, max_decode_depth=5)
 
         # Module should still be generated
         assert "module top" in content
@@ -356,7 +409,7 @@ class TestDepthExceedsHierarchy:
         assert "cpuif_err" in content
 
     def test_depth_1_on_flat_design(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 on a flat design (just registers at top) generates register interfaces."""
         rdl_source = """
@@ -366,35 +419,26 @@ class TestDepthExceedsHierarchy:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Registers are at depth 1, which is the limit
         assert "m_apb_reg_a" in content
         assert "m_apb_reg_b" in content
 
     def test_depth_exact_match_generates_interfaces(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Nodes exactly at the depth boundary get decoded."""
-        rdl_source = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child block @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
 
         # block at depth 1, reg1 at depth 2
         # depth=1: block is at boundary
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
         assert "m_apb_block" in content
         assert "m_apb_reg1" not in content
 
         # depth=2: reg1 is at boundary
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
         assert "m_apb_reg1" in content
         assert "m_apb_block" not in content
 
@@ -402,106 +446,54 @@ class TestDepthExceedsHierarchy:
 # ===========================================================================
 # 4. Arrayed components with depth control
 # ===========================================================================
+@pytest.mark.slow
 class TestArrayedComponentsWithDepth:
     """Verify that arrayed addressable components interact correctly with depth."""
 
-    def test_depth_1_with_arrayed_addrmap(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        """depth=1 with an arrayed addrmap generates an arrayed interface."""
-        rdl_source = """
-        addrmap child {
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child blocks[4] @ 0x0 += 0x100;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
-
-        # Arrayed interface
-        assert "m_apb_blocks" in content
-        # Should not expand to individual register interfaces
-        assert "m_apb_reg1" not in content
-
-    def test_depth_1_arrayed_addrmap_decode_logic(
-        self, compile_rdl: Callable[..., AddrmapNode]
+    @pytest.mark.parametrize(
+        "rdl, depth, present, absent",
+        [
+            # depth=1: one arrayed interface and a for-loop decoded array select,
+            # not expanded to individual register interfaces
+            pytest.param(
+                _ARRAYED_BLOCKS_RDL,
+                1,
+                ["m_apb_blocks", "logic blocks[4];"],
+                ["m_apb_reg1"],
+                id="depth-1-arrayed-interface",
+            ),
+            # depth=2: descends into the array to expose the child registers; the
+            # array itself has no interface of its own
+            pytest.param(_ARRAYED_BLOCKS_RDL, 2, ["m_apb_reg1"], ["m_apb_blocks"], id="depth-2-descends"),
+            # depth=0: descends all the way to every leaf register
+            pytest.param(
+                _ARRAYED_TWO_REG_BLOCKS_RDL,
+                0,
+                ["m_apb_reg1", "m_apb_reg2"],
+                ["m_apb_blocks"],
+                id="depth-0-all-leaves",
+            ),
+        ],
+    )
+    def test_arrayed_addrmap_at_depth(
+        self,
+        compile_rdl: Callable[..., AddrmapNode],
+        export_and_read: Callable[..., str],
+        rdl: str,
+        depth: int,
+        present: list[str],
+        absent: list[str],
     ) -> None:
-        """depth=1 with arrayed addrmaps generates for-loop decode logic."""
-        rdl_source = """
-        addrmap child {
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child blocks[4] @ 0x0 += 0x100;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
-
-        # Should have for loop for arrayed decode
-        assert "blocks[i0]" in content or "blocks" in content
-        # Array select signal
-        assert "logic blocks[4];" in content
-
-    def test_depth_2_descends_into_arrayed_addrmap(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        """depth=2 descends into arrayed addrmaps to expose child registers."""
-        rdl_source = """
-        addrmap child {
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child blocks[4] @ 0x0 += 0x100;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
-
-        # Should generate interfaces for registers inside the array
-        assert "m_apb_reg1" in content
-        # The array itself should not have its own interface
-        assert "m_apb_blocks" not in content
-
-    def test_depth_0_with_arrayed_addrmap(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        """depth=0 with arrayed addrmaps descends all the way to registers."""
-        rdl_source = """
-        addrmap child {
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg1 @ 0x0;
-            reg {
-                field { sw=rw; hw=r; } data[31:0];
-            } reg2 @ 0x4;
-        };
-
-        addrmap top {
-            child blocks[4] @ 0x0 += 0x100;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
-
-        # All leaf registers should have interfaces
-        assert "m_apb_reg1" in content
-        assert "m_apb_reg2" in content
-        assert "m_apb_blocks" not in content
+        """Arrayed addrmaps are decoded as one arrayed interface or descended into, by depth."""
+        top = compile_rdl(rdl, top="top")
+        content = export_and_read(top, max_decode_depth=depth)
+        for name in present:
+            assert name in content
+        for name in absent:
+            assert name not in content
 
     def test_depth_1_with_arrayed_registers(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with arrayed registers at top level."""
         rdl_source = """
@@ -512,7 +504,7 @@ class TestArrayedComponentsWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Arrayed register should be present
         assert "my_regs" in content
@@ -521,11 +513,12 @@ class TestArrayedComponentsWithDepth:
 # ===========================================================================
 # 5. Regfile components with depth control
 # ===========================================================================
+@pytest.mark.slow
 class TestRegfileWithDepth:
     """Verify depth behavior with regfile (addressable but not addrmap) nesting."""
 
     def test_depth_1_with_regfile(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with a regfile generates interface for the regfile."""
         rdl_source = """
@@ -543,7 +536,7 @@ class TestRegfileWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Should have interface for regfile
         assert "m_apb_rf_block" in content
@@ -552,7 +545,7 @@ class TestRegfileWithDepth:
         assert "m_apb_reg2" not in content
 
     def test_depth_2_descends_into_regfile(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 descends into a regfile to expose individual registers."""
         rdl_source = """
@@ -570,7 +563,7 @@ class TestRegfileWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # Should expose individual registers
         assert "m_apb_reg1" in content
@@ -579,7 +572,7 @@ class TestRegfileWithDepth:
         assert "m_apb_rf_block" not in content
 
     def test_depth_0_with_nested_regfile_in_addrmap(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0 descends fully through addrmap containing regfile."""
         rdl_source = """
@@ -601,7 +594,7 @@ class TestRegfileWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # All leaf registers visible
         assert "m_apb_rf_reg" in content
@@ -614,11 +607,12 @@ class TestRegfileWithDepth:
 # ===========================================================================
 # 6. External component interaction with depth
 # ===========================================================================
+@pytest.mark.slow
 class TestExternalWithDepth:
     """External components should remain as decode boundaries regardless of depth."""
 
     def test_depth_0_does_not_descend_into_external(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Even with depth=0 (all levels), external memories should not be descended into."""
         rdl_source = """
@@ -633,7 +627,7 @@ class TestExternalWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # External memory should have an interface
         assert "ext_mem" in content
@@ -641,7 +635,7 @@ class TestExternalWithDepth:
         assert "my_reg" in content
 
     def test_depth_1_with_mixed_external_and_internal(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with both external and internal components at top level."""
         rdl_source = """
@@ -660,7 +654,7 @@ class TestExternalWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Both external and internal should have interfaces at depth 1
         assert "ext_mem" in content
@@ -669,7 +663,7 @@ class TestExternalWithDepth:
         assert "m_apb_inner_reg" not in content
 
     def test_depth_0_external_alongside_non_external(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0: external child stays as boundary, non-external registers get decoded."""
         rdl_source = """
@@ -689,7 +683,7 @@ class TestExternalWithDepth:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # External stays as-is
         assert "ext_mem" in content
@@ -815,11 +809,12 @@ class TestGetAddressableChildrenAtDepth:
 # ===========================================================================
 # 8. Struct generation at different depths
 # ===========================================================================
+@pytest.mark.slow
 class TestStructGeneration:
     """Verify that generated select signal structs are correct at each depth."""
 
     def test_depth_1_flat_struct(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 should generate a flat cpuif_sel_t struct."""
         rdl_source = """
@@ -837,7 +832,7 @@ class TestStructGeneration:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Struct should be flat: logic ca; logic cb;
         assert "logic ca;" in content
@@ -847,7 +842,7 @@ class TestStructGeneration:
         assert "cpuif_sel_cb_t" not in content
 
     def test_depth_2_nested_struct(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 should generate nested struct types for intermediate addrmaps."""
         rdl_source = """
@@ -861,7 +856,7 @@ class TestStructGeneration:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # Nested struct type for the intermediate addrmap
         assert "cpuif_sel_block_t" in content
@@ -869,7 +864,7 @@ class TestStructGeneration:
         assert "logic r2;" in content
 
     def test_depth_0_deeply_nested_struct(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0 on multi-level hierarchy generates nested struct types.
 
@@ -891,7 +886,7 @@ class TestStructGeneration:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # Should have nested struct types at each level
         assert "cpuif_sel_outer_t" in content
@@ -904,11 +899,12 @@ class TestStructGeneration:
 # ===========================================================================
 # 9. Address decode logic correctness across depths
 # ===========================================================================
+@pytest.mark.slow
 class TestAddressDecodeCorrectness:
     """Verify address range comparisons in decode logic at different depths."""
 
     def test_depth_1_uses_child_total_size(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 should use the total_size of the child addrmap for address decode."""
         rdl_source = """
@@ -923,14 +919,14 @@ class TestAddressDecodeCorrectness:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # At depth 1, decode logic sets select for child addrmaps
         assert "cpuif_wr_sel.ca = 1'b1;" in content
         assert "cpuif_wr_sel.cb = 1'b1;" in content
 
     def test_depth_2_uses_register_address(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 should use individual register addresses for decode."""
         rdl_source = """
@@ -944,14 +940,14 @@ class TestAddressDecodeCorrectness:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # At depth 2, individual registers should have their own select signals
         assert "cpuif_wr_sel.block.r1 = 1'b1;" in content
         assert "cpuif_wr_sel.block.r2 = 1'b1;" in content
 
     def test_depth_0_all_registers_in_decode(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0 should generate decode paths for every leaf register."""
         rdl_source = """
@@ -965,27 +961,18 @@ class TestAddressDecodeCorrectness:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # Both registers should have decode logic
         assert "cpuif_wr_sel.blk.r_deep = 1'b1;" in content
         assert "cpuif_wr_sel.r_top = 1'b1;" in content
 
     def test_depth_1_error_path_for_invalid_address(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Addresses outside valid ranges should set cpuif_err."""
-        rdl_source = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child block @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
+        content = export_and_read(top, max_decode_depth=1)
 
         # Error path should exist in decode logic
         assert "cpuif_wr_sel.cpuif_err = 1'b1;" in content
@@ -995,57 +982,31 @@ class TestAddressDecodeCorrectness:
 # ===========================================================================
 # 10. Protocol consistency
 # ===========================================================================
+@pytest.mark.slow
 class TestProtocolConsistency:
     """Verify that depth behavior is consistent across different cpuif protocols."""
 
-    def _get_3level_rdl(self) -> str:
-        return """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child block @ 0x0;
-        };
-        """
-
-    def test_apb3_depth_1(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=1, cpuif_cls=APB3Cpuif)
-        assert "m_apb_block" in content
-        assert "m_apb_reg1" not in content
-
-    def test_apb4_depth_1(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=1, cpuif_cls=APB4Cpuif)
-        assert "m_apb_block" in content
-        assert "m_apb_reg1" not in content
-
-    def test_axi4lite_depth_1(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=1, cpuif_cls=AXI4LiteCpuif)
-        # AXI4-Lite uses m_axil_ prefix
-        assert "m_axil_block" in content
-
-    def test_apb3_depth_2(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=2, cpuif_cls=APB3Cpuif)
-        assert "m_apb_reg1" in content
-        assert "m_apb_block" not in content
-
-    def test_apb4_depth_2(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=2, cpuif_cls=APB4Cpuif)
-        assert "m_apb_reg1" in content
-        assert "m_apb_block" not in content
+    @pytest.mark.parametrize("depth", [1, 2])
+    @pytest.mark.parametrize("cpuif_cls", [APB3Cpuif, APB4Cpuif, AXI4LiteCpuif])
+    def test_boundary_interfaces(
+        self,
+        compile_rdl: Callable[..., AddrmapNode],
+        export_and_read: Callable[..., str],
+        cpuif_cls: type,
+        depth: int,
+    ) -> None:
+        """Each protocol exposes the block at depth=1 and its register at depth=2."""
+        # AXI4-Lite uses m_axil_ prefix, both APB flavours use m_apb_
+        prefix = "m_axil_" if cpuif_cls is AXI4LiteCpuif else "m_apb_"
+        present, absent = ("block", "reg1") if depth == 1 else ("reg1", "block")
 
-    def test_axi4lite_depth_2(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
-        top = compile_rdl(self._get_3level_rdl(), top="top")
-        content = _export_and_read(top, max_decode_depth=2, cpuif_cls=AXI4LiteCpuif)
-        assert "m_axil_reg1" in content
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
+        content = export_and_read(top, max_decode_depth=depth, cpuif_cls=cpuif_cls)
+        assert f"{prefix}{present}" in content
+        assert f"{prefix}{absent}" not in content
 
     def test_all_protocols_produce_same_struct_depth_1(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """All protocols should produce the same select struct shape for depth=1."""
         rdl_source = """
@@ -1060,7 +1021,7 @@ class TestProtocolConsistency:
         top = compile_rdl(rdl_source, top="top")
 
         for cpuif_cls in (APB3Cpuif, APB4Cpuif, AXI4LiteCpuif):
-            content = _export_and_read(top, max_decode_depth=1, cpuif_cls=cpuif_cls)
+            content = export_and_read(top, max_decode_depth=1, cpuif_cls=cpuif_cls)
             # All protocols should have select struct with ca and cb
             assert "logic ca;" in content
             assert "logic cb;" in content
@@ -1069,24 +1030,16 @@ class TestProtocolConsistency:
 # ===========================================================================
 # 11. Depth with cpuif_unroll interaction
 # ===========================================================================
+@pytest.mark.slow
 class TestDepthWithUnroll:
     """Verify that max_decode_depth interacts correctly with cpuif_unroll."""
 
     def test_depth_1_unrolled_array(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with unrolled arrays should produce individual interfaces."""
-        rdl_source = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-
-        addrmap top {
-            child blocks[4] @ 0x0 += 0x100;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1, cpuif_unroll=True)
+        top = compile_rdl(_ARRAYED_BLOCKS_RDL, top="top")
+        content = export_and_read(top, max_decode_depth=1, cpuif_unroll=True)
 
         # Unrolled should generate individual interfaces
         assert "blocks" in content
@@ -1098,101 +1051,56 @@ class TestDepthWithUnroll:
 class TestDesignStateDepthConfig:
     """Test DesignState initialization with various depth values."""
 
-    def test_default_depth_is_1(
-        self, compile_rdl: Callable[..., AddrmapNode]
+    @pytest.mark.parametrize(
+        "cfg, expected",
+        [
+            # Omitted from the config: defaults to decoding one level deep
+            pytest.param({}, 1, id="default"),
+            pytest.param({"max_decode_depth": 0}, 0, id="explicit-0"),
+            pytest.param({"max_decode_depth": 3}, 3, id="explicit-3"),
+            # Deeper than the design: stored as given
+            pytest.param({"max_decode_depth": 100}, 100, id="large"),
+        ],
+    )
+    def test_max_decode_depth(
+        self, compile_rdl: Callable[..., AddrmapNode], cfg: dict[str, int], expected: int
     ) -> None:
-        rdl = """
-        addrmap top {
-            reg { field { sw=rw; hw=r; } data[31:0]; } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="top")
-        ds = DesignState(top, {})
-        assert ds.max_decode_depth == 1
-
-    def test_explicit_depth_0(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        rdl = """
-        addrmap top {
-            reg { field { sw=rw; hw=r; } data[31:0]; } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="top")
-        ds = DesignState(top, {"max_decode_depth": 0})
-        assert ds.max_decode_depth == 0
-
-    def test_explicit_depth_3(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        rdl = """
-        addrmap top {
-            reg { field { sw=rw; hw=r; } data[31:0]; } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="top")
-        ds = DesignState(top, {"max_decode_depth": 3})
-        assert ds.max_decode_depth == 3
-
-    def test_large_depth_value(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        rdl = """
-        addrmap top {
-            reg { field { sw=rw; hw=r; } data[31:0]; } my_reg @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="top")
-        ds = DesignState(top, {"max_decode_depth": 100})
-        assert ds.max_decode_depth == 100
+        top = compile_rdl(_SINGLE_REG_RDL, top="top")
+        ds = DesignState(top, cfg)
+        assert ds.max_decode_depth == expected
 
 
 # ===========================================================================
 # 13. Fanout/fanin path correctness at various depths
 # ===========================================================================
+@pytest.mark.slow
 class TestFanoutFaninPaths:
     """Verify that fanout and fanin use the correct hierarchical paths."""
 
     def test_depth_1_fanout_uses_top_level_name(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 fanout should reference top-level child name."""
-        rdl_source = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-        addrmap top {
-            child blk @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
+        content = export_and_read(top, max_decode_depth=1)
 
-        assert "m_apb_blk.PSEL" in content
-        assert "cpuif_wr_sel.blk" in content
-        assert "cpuif_rd_sel.blk" in content
+        assert "m_apb_block.PSEL" in content
+        assert "cpuif_wr_sel.block" in content
+        assert "cpuif_rd_sel.block" in content
 
     def test_depth_2_fanout_uses_hierarchical_path(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 fanout should reference hierarchical child.register path."""
-        rdl_source = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-        addrmap top {
-            child blk @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        top = compile_rdl(_CHILD_BLOCK_RDL, top="top")
+        content = export_and_read(top, max_decode_depth=2)
 
         assert "m_apb_reg1.PSEL" in content
-        assert "cpuif_wr_sel.blk.reg1" in content
-        assert "cpuif_rd_sel.blk.reg1" in content
+        assert "cpuif_wr_sel.block.reg1" in content
+        assert "cpuif_rd_sel.block.reg1" in content
 
     def test_depth_0_fanin_references_all_leaves(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0 fanin should reference all leaf register paths."""
         rdl_source = """
@@ -1205,7 +1113,7 @@ class TestFanoutFaninPaths:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # Fanin should have conditions for all leaf registers
         assert "cpuif_wr_sel.blk.ra" in content
@@ -1217,11 +1125,12 @@ class TestFanoutFaninPaths:
 # ===========================================================================
 # 14. Complex hierarchies with multiple branches
 # ===========================================================================
+@pytest.mark.slow
 class TestComplexHierarchies:
     """Test depth with more complex, real-world-like hierarchies."""
 
     def test_depth_1_with_wide_hierarchy(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=1 with many top-level children of different types."""
         rdl_source = """
@@ -1242,7 +1151,7 @@ class TestComplexHierarchies:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # All four top-level children should have interfaces
         assert "m_apb_control" in content
@@ -1255,7 +1164,7 @@ class TestComplexHierarchies:
         assert "m_apb_config" not in content
 
     def test_depth_2_with_asymmetric_branches(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 where different branches have different depths of nesting."""
         rdl_source = """
@@ -1279,7 +1188,7 @@ class TestComplexHierarchies:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # Depth 2 nodes: inside complex_blk we get nested and wrapper_reg,
         # inside simple_blk we get shallow_r1 and shallow_r2
@@ -1287,7 +1196,6 @@ class TestComplexHierarchies:
         assert "m_apb_wrapper_reg" in content
         assert "m_apb_shallow_r1" in content
         assert "m_apb_shallow_r2" in content
-
         # Top-level addrmaps should NOT have their own interfaces
         assert "m_apb_complex_blk" not in content
         assert "m_apb_simple_blk" not in content
@@ -1295,7 +1203,7 @@ class TestComplexHierarchies:
         assert "m_apb_deep_reg" not in content
 
     def test_depth_0_multi_branch_hierarchy(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=0 on a multi-branch hierarchy reaches all leaves.
 
@@ -1330,7 +1238,7 @@ class TestComplexHierarchies:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
+        content = export_and_read(top, max_decode_depth=0)
 
         # All leaf registers should be referenced
         assert "m_apb_leaf_ra" in content
@@ -1349,64 +1257,40 @@ class TestComplexHierarchies:
 # ===========================================================================
 # 15. Error signal generation at different depths
 # ===========================================================================
+@pytest.mark.slow
 class TestErrorSignalGeneration:
     """cpuif_err should always be generated in the select struct, regardless of depth."""
 
-    def test_error_signal_in_struct_at_depth_1(
-        self, compile_rdl: Callable[..., AddrmapNode]
+    @pytest.mark.parametrize(
+        "rdl, depth",
+        [
+            pytest.param(_CHILD_BLOCK_RDL, 1, id="depth-1"),
+            pytest.param(_CHILD_BLOCK_RDL, 0, id="depth-0"),
+            # Depth 3 on a 3-level hierarchy still has error signal
+            pytest.param(_THREE_LEVEL_RDL, 3, id="depth-3"),
+        ],
+    )
+    def test_error_signal_in_struct(
+        self,
+        compile_rdl: Callable[..., AddrmapNode],
+        export_and_read: Callable[..., str],
+        rdl: str,
+        depth: int,
     ) -> None:
-        rdl = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-        addrmap top { child blk @ 0x0; };
-        """
         top = compile_rdl(rdl, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
-        assert "cpuif_err" in content
-
-    def test_error_signal_in_struct_at_depth_0(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        rdl = """
-        addrmap child {
-            reg { field { sw=rw; hw=r; } data[31:0]; } reg1 @ 0x0;
-        };
-        addrmap top { child blk @ 0x0; };
-        """
-        top = compile_rdl(rdl, top="top")
-        content = _export_and_read(top, max_decode_depth=0)
-        assert "cpuif_err" in content
-
-    def test_error_signal_in_struct_at_depth_3(
-        self, compile_rdl: Callable[..., AddrmapNode]
-    ) -> None:
-        """Depth 3 on a 3-level hierarchy still has error signal."""
-        rdl = """
-        addrmap l2 {
-            reg { field { sw=rw; hw=r; } data[31:0]; } l2_reg @ 0x0;
-        };
-        addrmap l1 {
-            reg { field { sw=rw; hw=r; } data[31:0]; } l1_reg @ 0x0;
-            l2 sub @ 0x10;
-        };
-        addrmap top {
-            l1 blk @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl, top="top")
-        content = _export_and_read(top, max_decode_depth=3)
+        content = export_and_read(top, max_decode_depth=depth)
         assert "cpuif_err" in content
 
 
 # ===========================================================================
 # 16. Depth with arrayed register components
 # ===========================================================================
+@pytest.mark.slow
 class TestDepthWithArrayedRegisters:
     """Verify correct behavior when registers themselves are arrayed."""
 
     def test_depth_1_arrayed_registers_at_top(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Arrayed registers at top level with depth=1."""
         rdl_source = """
@@ -1417,13 +1301,13 @@ class TestDepthWithArrayedRegisters:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=1)
+        content = export_and_read(top, max_decode_depth=1)
 
         # Arrayed register should be present
         assert "my_regs" in content
 
     def test_depth_2_arrayed_registers_inside_addrmap(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Arrayed registers inside an addrmap with depth=2."""
         rdl_source = """
@@ -1438,7 +1322,7 @@ class TestDepthWithArrayedRegisters:
         };
         """
         top = compile_rdl(rdl_source, top="top")
-        content = _export_and_read(top, max_decode_depth=2)
+        content = export_and_read(top, max_decode_depth=2)
 
         # At depth=2, we should see the arrayed register inside the addrmap
         assert "status_regs" in content
@@ -1448,11 +1332,12 @@ class TestDepthWithArrayedRegisters:
 # ===========================================================================
 # 17. Depth comparison: same design at multiple depths
 # ===========================================================================
+@pytest.mark.slow
 class TestDepthComparison:
     """Compare generated output for the same design at different depth settings."""
 
     def test_increasing_depth_increases_interfaces(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """Increasing depth should expose more (or equal) interfaces."""
         rdl_source = """
@@ -1472,24 +1357,18 @@ class TestDepthComparison:
         """
         top = compile_rdl(rdl_source, top="top")
 
-        # depth=1: 1 interface (inner1)
-        c1 = _export_and_read(top, max_decode_depth=1)
-        n1 = c1.count("apb4_intf.master")
-
-        # depth=2: 2 interfaces (reg1, inner2)
-        c2 = _export_and_read(top, max_decode_depth=2)
-        n2 = c2.count("apb4_intf.master")
-
-        # depth=0: 3 interfaces (reg1, reg2, reg2b)
-        c0 = _export_and_read(top, max_decode_depth=0)
-        n0 = c0.count("apb4_intf.master")
-
-        assert n1 == 1
-        assert n2 == 2
-        assert n0 == 3
+        counts = {
+            depth: export_and_read(top, max_decode_depth=depth).count("apb4_intf.master")
+            for depth in (1, 2, 0)
+        }
+        assert counts == {
+            1: 1,  # inner1
+            2: 2,  # reg1, inner2
+            0: 3,  # reg1, reg2, reg2b
+        }
 
     def test_depth_1_vs_2_struct_complexity(
-        self, compile_rdl: Callable[..., AddrmapNode]
+        self, compile_rdl: Callable[..., AddrmapNode], export_and_read: Callable[..., str]
     ) -> None:
         """depth=2 should produce more complex structs than depth=1."""
         rdl_source = """
@@ -1504,8 +1383,8 @@ class TestDepthComparison:
         """
         top = compile_rdl(rdl_source, top="top")
 
-        c1 = _export_and_read(top, max_decode_depth=1)
-        c2 = _export_and_read(top, max_decode_depth=2)
+        c1 = export_and_read(top, max_decode_depth=1)
+        c2 = export_and_read(top, max_decode_depth=2)
 
         # depth=1: flat struct (no nested types)
         assert "cpuif_sel_block_t" not in c1
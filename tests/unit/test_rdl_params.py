@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from pathlib import Path
 
+import pytest
 from systemrdl.node import AddrmapNode
 
 from peakrdl_busdecoder import BusDecoderExporter, ParameterUsage, RdlParameterExtractor
@@ -167,6 +168,7 @@ class TestRdlParameterSvProperties:
         assert params[0].sv_value == "10"
 
 
+@pytest.mark.slow
 class TestRdlParameterIntegration:
     """Tests for end-to-end parameter integration in the exporter."""
 
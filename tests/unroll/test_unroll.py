@@ -1,7 +1,8 @@
 import re
+from collections.abc import Hashable, Iterable
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
+import pytest
 from systemrdl.node import AddrmapNode
 
 from peakrdl_busdecoder import BusDecoderExporter
@@ -9,49 +10,93 @@ from peakrdl_busdecoder.cpuif.apb3 import APB3Cpuif
 from peakrdl_busdecoder.cpuif.apb4 import APB4Cpuif
 from peakrdl_busdecoder.cpuif.axi4lite import AXI4LiteCpuif
 
+pytestmark = pytest.mark.slow
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+# Rendered (module, package) text per design and export options. Keyed on
+# id(rdl_node); each entry also holds the node itself so the id cannot be
+# recycled by another design while the entry exists.
+_EXPORT_CACHE: dict[tuple[Hashable, ...], tuple[AddrmapNode, tuple[str, str]]] = {}
+
+
 def _export(
     rdl_node: AddrmapNode,
     cpuif_cls: type = APB4Cpuif,
     unroll: bool = True,
     **kwargs: object,
 ) -> tuple[str, str]:
-    """Export a design and return (module_content, package_content)."""
-    with TemporaryDirectory() as tmpdir:
-        exporter = BusDecoderExporter()
-        exporter.export(
+    """Export a design and return (module_content, package_content).
+
+    Results are memoized, so tests that render the same design with the same
+    options share a single export. The returned text must not be modified.
+    """
+    key = (id(rdl_node), cpuif_cls, unroll, tuple(sorted(kwargs.items())))
+    entry = _EXPORT_CACHE.get(key)
+    if entry is None:
+        files = BusDecoderExporter().render(
             rdl_node,
-            tmpdir,
             cpuif_cls=cpuif_cls,
             cpuif_unroll=unroll,
             **kwargs,
         )
         module_name = rdl_node.inst_name
-        module_content = (Path(tmpdir) / f"{module_name}.sv").read_text()
-        package_content = (Path(tmpdir) / f"{module_name}_pkg.sv").read_text()
-    return module_content, package_content
+        entry = _EXPORT_CACHE[key] = (rdl_node, (files[f"{module_name}.sv"], files[f"{module_name}_pkg.sv"]))
+    return entry[1]
+
+
+_LOCALPARAM_NAME = re.compile(r"^\s*localparam\s+(\S+)", re.MULTILINE)
+_SEL_STRUCT = re.compile(r"typedef struct \{(.*?)\} cpuif_sel_t;", re.DOTALL)
+_MODULE_HEADER = re.compile(r"module top\s*\((.*?)\);", re.DOTALL)
+_MIN_ADDR_WIDTH_PARAM = re.compile(r"TOP_MIN_ADDR_WIDTH\s*=\s*(\d+)")
+_DATA_WIDTH_PARAM = re.compile(r"TOP_DATA_WIDTH\s*=\s*(\d+)")
 
 
 def _assert_no_duplicate_localparams(pkg_content: str) -> None:
     """Assert the package contains no duplicate localparam declarations."""
-    localparam_lines = [
-        line.strip() for line in pkg_content.splitlines() if line.strip().startswith("localparam")
-    ]
-    localparam_names = []
-    for line in localparam_lines:
-        parts = line.split()
-        if len(parts) >= 2:
-            localparam_names.append(parts[1])
+    localparam_names = _LOCALPARAM_NAME.findall(pkg_content)
 
     assert len(localparam_names) == len(set(localparam_names)), (
         f"Duplicate localparam declarations found: {localparam_names}"
     )
 
 
+def _split_module(content: str) -> tuple[str, str]:
+    """Split a generated module into its port list and everything after it."""
+    header_match = _MODULE_HEADER.search(content)
+    assert header_match is not None, "module header not found in output"
+    return header_match.group(1), content[header_match.end() :]
+
+
+def _assert_contains_in_order(content: str, expected: Iterable[str]) -> None:
+    """Assert that ``content`` contains every string of ``expected``, in order."""
+    cursor = 0
+    for needle in expected:
+        idx = content.find(needle, cursor)
+        assert idx >= 0, f"{needle!r} missing from output after offset {cursor}"
+        cursor = idx + len(needle)
+
+
+# An unrolled m_apb_regs_N reference, with what follows it: "," or a newline
+# where the port is declared, or an array dimension it must not carry.
+_REGS_PORT = re.compile(r"m_apb_regs_(\d+)(\s*\[\d+\]|[,\n])?")
+
+
+def _regs_port_indices(content: str) -> tuple[set[str], set[str]]:
+    """Return the indices of m_apb_regs_N ports declared bare and declared with array dimensions."""
+    declared: set[str] = set()
+    arrayed: set[str] = set()
+    for index, tail in _REGS_PORT.findall(content):
+        if tail in (",", "\n"):
+            declared.add(index)
+        elif tail:
+            arrayed.add(index)
+    return declared, arrayed
+
+
 # ===========================================================================
 # A. Port declaration tests
 # ===========================================================================
@@ -78,21 +123,14 @@ def test_unroll_enabled_creates_individual_interfaces(sample_rdl: AddrmapNode) -
     """Test that with unroll=True, array elements are unrolled into separate instances."""
     content, _ = _export(sample_rdl, unroll=True)
 
-    # Should have individual interfaces without array dimensions
-    assert "m_apb_regs_0," in content or "m_apb_regs_0\n" in content
-    assert "m_apb_regs_1," in content or "m_apb_regs_1\n" in content
-    assert "m_apb_regs_2," in content or "m_apb_regs_2\n" in content
-    assert "m_apb_regs_3" in content
+    # Should have individual interfaces without array dimensions (the bug we're fixing)
+    declared, arrayed = _regs_port_indices(content)
+    assert declared == {"0", "1", "2", "3"}
+    assert not arrayed
 
     # Should NOT have array interface
     assert "m_apb_regs [4]" not in content
 
-    # Should NOT have individual interfaces with array dimensions (the bug we're fixing)
-    assert "m_apb_regs_0 [4]" not in content
-    assert "m_apb_regs_1 [4]" not in content
-    assert "m_apb_regs_2 [4]" not in content
-    assert "m_apb_regs_3 [4]" not in content
-
     # Should NOT have array size parameter when unrolled
     assert "N_REGSS" not in content
 
@@ -101,14 +139,10 @@ def test_unroll_with_apb3(sample_rdl: AddrmapNode) -> None:
     """Test that unroll works correctly with APB3 interface."""
     content, _ = _export(sample_rdl, cpuif_cls=APB3Cpuif, unroll=True)
 
-    # Should have individual APB3 interfaces
-    assert "m_apb_regs_0," in content or "m_apb_regs_0\n" in content
-    assert "m_apb_regs_1," in content or "m_apb_regs_1\n" in content
-    assert "m_apb_regs_2," in content or "m_apb_regs_2\n" in content
-    assert "m_apb_regs_3" in content
-
-    # Should NOT have array dimensions on unrolled interfaces
-    assert "m_apb_regs_0 [4]" not in content
+    # Should have individual APB3 interfaces, without array dimensions
+    declared, arrayed = _regs_port_indices(content)
+    assert declared == {"0", "1", "2", "3"}
+    assert not arrayed
 
 
 def test_unroll_multidimensional_array(multidim_array_rdl: AddrmapNode) -> None:
@@ -117,12 +151,9 @@ def test_unroll_multidimensional_array(multidim_array_rdl: AddrmapNode) -> None:
 
     # Should have individual interfaces for each element in the 2x3 array
     # Format should be m_apb_matrix_0_0, m_apb_matrix_0_1, ..., m_apb_matrix_1_2
-    assert "m_apb_matrix_0_0" in content
-    assert "m_apb_matrix_0_1" in content
-    assert "m_apb_matrix_0_2" in content
-    assert "m_apb_matrix_1_0" in content
-    assert "m_apb_matrix_1_1" in content
-    assert "m_apb_matrix_1_2" in content
+    for i in range(2):
+        for j in range(3):
+            assert f"m_apb_matrix_{i}_{j}" in content
 
     # Should NOT have array dimensions on any of the unrolled interfaces
     for i in range(2):
@@ -224,21 +255,23 @@ class TestUnrollFanin:
 class TestUnrollPackage:
     """Verify that the generated package is correct when unrolled."""
 
-    def test_no_duplicate_localparams(self, sample_rdl: AddrmapNode) -> None:
+    @pytest.mark.parametrize(
+        "design, cpuif_cls",
+        [
+            pytest.param("sample_rdl", APB4Cpuif, id="array"),
+            pytest.param("sample_rdl", APB3Cpuif, id="array-apb3"),
+            # External block arrays
+            pytest.param("external_array_rdl", APB4Cpuif, id="external-array"),
+            pytest.param("multidim_array_rdl", APB4Cpuif, id="multidim"),
+            # Multiple distinct arrays should each have at most one addr_width param
+            pytest.param("multiple_arrays_rdl", APB4Cpuif, id="multiple-arrays"),
+        ],
+    )
+    def test_no_duplicate_localparams(
+        self, request: pytest.FixtureRequest, design: str, cpuif_cls: type
+    ) -> None:
         """When unrolled, the package should not contain duplicate localparam declarations."""
-        _, pkg_content = _export(sample_rdl, unroll=True)
-
-        _assert_no_duplicate_localparams(pkg_content)
-
-    def test_no_duplicate_localparams_external_array(self, external_array_rdl: AddrmapNode) -> None:
-        """External block arrays should also not produce duplicate localparams when unrolled."""
-        _, pkg_content = _export(external_array_rdl, unroll=True)
-
-        _assert_no_duplicate_localparams(pkg_content)
-
-    def test_no_duplicate_localparams_multidim(self, multidim_array_rdl: AddrmapNode) -> None:
-        """Multi-dimensional arrays should also not produce duplicate localparams when unrolled."""
-        _, pkg_content = _export(multidim_array_rdl, unroll=True)
+        _, pkg_content = _export(request.getfixturevalue(design), cpuif_cls=cpuif_cls, unroll=True)
 
         _assert_no_duplicate_localparams(pkg_content)
 
@@ -249,12 +282,6 @@ class TestUnrollPackage:
         count = pkg_content.count("TOP_REGS_ADDR_WIDTH")
         assert count == 1, f"Expected exactly 1 TOP_REGS_ADDR_WIDTH declaration, got {count}"
 
-    def test_multiple_arrays_no_duplicate_localparams(self, multiple_arrays_rdl: AddrmapNode) -> None:
-        """Multiple distinct arrays should each have at most one addr_width param when unrolled."""
-        _, pkg_content = _export(multiple_arrays_rdl, unroll=True)
-
-        _assert_no_duplicate_localparams(pkg_content)
-
 
 # ===========================================================================
 # E. Struct generation tests
@@ -275,7 +302,7 @@ class TestUnrollStruct:
         content, _ = _export(sample_rdl, unroll=True)
 
         # Extract the struct definition
-        struct_match = re.search(r"typedef struct \{(.*?)\} cpuif_sel_t;", content, re.DOTALL)
+        struct_match = _SEL_STRUCT.search(content)
         assert struct_match is not None, "cpuif_sel_t struct not found in output"
         struct_body = struct_match.group(1)
 
@@ -293,7 +320,7 @@ class TestUnrollStruct:
         """When NOT unrolled, the struct should use array notation."""
         content, _ = _export(sample_rdl, unroll=False)
 
-        struct_match = re.search(r"typedef struct \{(.*?)\} cpuif_sel_t;", content, re.DOTALL)
+        struct_match = _SEL_STRUCT.search(content)
         assert struct_match is not None
         struct_body = struct_match.group(1)
 
@@ -320,15 +347,12 @@ class TestUnrollDecodeLogic:
         # The write and read decoders must reference all 4 elements
         # They should appear as either regs[0]..regs[3] or regs_0..regs_3
         for flavor in ("wr_sel", "rd_sel"):
-            element_refs = []
-            for i in range(4):
-                # Check for array or individual references
-                has_array_ref = f"cpuif_{flavor}.regs[{i}]" in content
-                has_indexed_ref = f"cpuif_{flavor}.regs[i" in content  # for loop
-                has_individual_ref = f"cpuif_{flavor}.regs_{i}" in content
-                element_refs.append(has_array_ref or has_indexed_ref or has_individual_ref)
-
-            assert all(element_refs), f"Decode logic for {flavor} does not cover all 4 elements"
+            ref = f"cpuif_{flavor}.regs"
+            # A for loop over regs[i...] covers every element at once
+            covers_all = f"{ref}[i" in content or all(
+                f"{ref}[{i}]" in content or f"{ref}_{i}" in content for i in range(4)
+            )
+            assert covers_all, f"Decode logic for {flavor} does not cover all 4 elements"
 
     def test_decode_logic_disabled_uses_for_loops(self, sample_rdl: AddrmapNode) -> None:
         """When NOT unrolled, the decode logic should use for-loops for arrays."""
@@ -346,23 +370,35 @@ class TestUnrollDecodeLogic:
 class TestUnrollProtocols:
     """Test unroll with different CPU interface protocols."""
 
-    def test_axi4lite_unroll_port_declarations(self, sample_rdl: AddrmapNode) -> None:
-        """AXI4-Lite should generate individual interface instances when unrolled."""
-        content, _ = _export(sample_rdl, cpuif_cls=AXI4LiteCpuif, unroll=True)
-
-        # Should have individual AXI4-Lite master interfaces
-        for i in range(4):
-            assert f"m_axil_regs_{i}" in content
+    @pytest.mark.parametrize(
+        "cpuif_cls, port",
+        [
+            pytest.param(APB3Cpuif, "m_apb_regs", id="apb3"),
+            pytest.param(APB4Cpuif, "m_apb_regs", id="apb4"),
+            pytest.param(AXI4LiteCpuif, "m_axil_regs", id="axi4lite"),
+        ],
+    )
+    def test_unroll_individual_ports(self, sample_rdl: AddrmapNode, cpuif_cls: type, port: str) -> None:
+        """Every protocol should declare and drive individual interface instances when unrolled.
 
-        # Should NOT have array interface
-        assert "m_axil_regs [4]" not in content
+        All references to master ports should use individual instance names,
+        never array-indexed names.
+        """
+        content, _ = _export(sample_rdl, cpuif_cls=cpuif_cls, unroll=True)
+        header, body = _split_module(content)
 
-    def test_axi4lite_unroll_no_array_size_param(self, sample_rdl: AddrmapNode) -> None:
-        """AXI4-Lite should not have N_XXXS parameter when unrolled."""
-        content, _ = _export(sample_rdl, cpuif_cls=AXI4LiteCpuif, unroll=True)
+        # Individual master interfaces, declared as ports and referenced by the fanout
+        for i in range(4):
+            assert f"intf.master {port}_{i}" in header
+            assert f"{port}_{i}." in body
 
+        # Should NOT have array interface or its size parameter
+        assert f"{port} [4]" not in content
         assert "N_REGSS" not in content
 
+        # Should NOT have array-indexed master port references
+        assert f"{port}[" not in content
+
     def test_axi4lite_disabled_creates_array(self, sample_rdl: AddrmapNode) -> None:
         """AXI4-Lite should create array interface when unroll is disabled."""
         content, _ = _export(sample_rdl, cpuif_cls=AXI4LiteCpuif, unroll=False)
@@ -370,34 +406,6 @@ class TestUnrollProtocols:
         assert "m_axil_regs [4]" in content
         assert "N_REGSS = 4" in content
 
-    def test_apb3_unroll_fanout_individual_ports(self, sample_rdl: AddrmapNode) -> None:
-        """APB3 fanout should reference individual ports when unrolled."""
-        content, _ = _export(sample_rdl, cpuif_cls=APB3Cpuif, unroll=True)
-
-        for i in range(4):
-            assert f"m_apb_regs_{i}." in content
-
-        assert "m_apb_regs[" not in content
-
-    def test_apb3_unroll_no_duplicate_localparams(self, sample_rdl: AddrmapNode) -> None:
-        """APB3 package should not have duplicate localparams when unrolled."""
-        _, pkg_content = _export(sample_rdl, cpuif_cls=APB3Cpuif, unroll=True)
-
-        _assert_no_duplicate_localparams(pkg_content)
-
-    def test_apb4_unroll_all_signals_consistent(self, sample_rdl: AddrmapNode) -> None:
-        """APB4 should have consistent signal references throughout when unrolled.
-
-        All references to master ports should use individual instance names,
-        never array-indexed names.
-        """
-        content, _ = _export(sample_rdl, cpuif_cls=APB4Cpuif, unroll=True)
-
-        # Collect all references to master APB port signals
-        # They should all be individual (m_apb_regs_N.signal), never array-indexed
-        array_refs = re.findall(r"m_apb_regs\[\w+\]", content)
-        assert len(array_refs) == 0, f"Found array-indexed master port references when unrolled: {array_refs}"
-
     def test_multidim_axi4lite_unroll(self, multidim_array_rdl: AddrmapNode) -> None:
         """AXI4-Lite should correctly handle multi-dimensional array unrolling."""
         content, _ = _export(multidim_array_rdl, cpuif_cls=AXI4LiteCpuif, unroll=True)
@@ -475,49 +483,36 @@ class TestUnrollEdgeCases:
         assert "m_apb_blocks [4]" not in content
         assert "m_apb_blocks[" not in content
 
-    def test_external_block_array_no_duplicate_localparams(self, external_array_rdl: AddrmapNode) -> None:
-        """External block array package should not have duplicate localparams when unrolled."""
-        _, pkg_content = _export(external_array_rdl, unroll=True)
-
-        _assert_no_duplicate_localparams(pkg_content)
-
-    def test_address_width_unaffected_by_unroll(self, sample_rdl: AddrmapNode) -> None:
-        """The address width should be the same regardless of the unroll flag."""
-        _, pkg_unrolled = _export(sample_rdl, unroll=True)
-        _, pkg_normal = _export(sample_rdl, unroll=False)
-
-        def extract_min_addr_width(pkg: str) -> str:
-            match = re.search(r"TOP_MIN_ADDR_WIDTH\s*=\s*(\d+)", pkg)
-            assert match is not None, "Could not find TOP_MIN_ADDR_WIDTH"
-            return match.group(1)
-
-        assert extract_min_addr_width(pkg_unrolled) == extract_min_addr_width(pkg_normal)
-
-    def test_data_width_unaffected_by_unroll(self, sample_rdl: AddrmapNode) -> None:
-        """The data width should be the same regardless of the unroll flag."""
+    @pytest.mark.parametrize(
+        "width_param",
+        [
+            pytest.param(_MIN_ADDR_WIDTH_PARAM, id="address-width"),
+            pytest.param(_DATA_WIDTH_PARAM, id="data-width"),
+        ],
+    )
+    def test_width_unaffected_by_unroll(self, sample_rdl: AddrmapNode, width_param: re.Pattern[str]) -> None:
+        """The address and data widths should be the same regardless of the unroll flag."""
         _, pkg_unrolled = _export(sample_rdl, unroll=True)
         _, pkg_normal = _export(sample_rdl, unroll=False)
 
-        def extract_data_width(pkg: str) -> str:
-            match = re.search(r"TOP_DATA_WIDTH\s*=\s*(\d+)", pkg)
-            assert match is not None, "Could not find TOP_DATA_WIDTH"
-            return match.group(1)
-
-        assert extract_data_width(pkg_unrolled) == extract_data_width(pkg_normal)
+        unrolled_match = width_param.search(pkg_unrolled)
+        normal_match = width_param.search(pkg_normal)
+        assert unrolled_match is not None, f"Could not find {width_param.pattern}"
+        assert normal_match is not None, f"Could not find {width_param.pattern}"
+        assert unrolled_match.group(1) == normal_match.group(1)
 
-    def test_both_files_generated_with_unroll(self, sample_rdl: AddrmapNode) -> None:
+    def test_both_files_generated_with_unroll(self, sample_rdl: AddrmapNode, tmp_path: Path) -> None:
         """Both the module and package files should be generated when unrolling."""
-        with TemporaryDirectory() as tmpdir:
-            exporter = BusDecoderExporter()
-            exporter.export(
-                sample_rdl,
-                tmpdir,
-                cpuif_cls=APB4Cpuif,
-                cpuif_unroll=True,
-            )
+        exporter = BusDecoderExporter()
+        exporter.export(
+            sample_rdl,
+            str(tmp_path),
+            cpuif_cls=APB4Cpuif,
+            cpuif_unroll=True,
+        )
 
-            assert (Path(tmpdir) / "top.sv").exists()
-            assert (Path(tmpdir) / "top_pkg.sv").exists()
+        assert (tmp_path / "top.sv").exists()
+        assert (tmp_path / "top_pkg.sv").exists()
 
     def test_multiple_arrays_unroll(self, multiple_arrays_rdl: AddrmapNode) -> None:
         """Multiple distinct arrays should all be unrolled independently."""
@@ -542,11 +537,11 @@ class TestUnrollEdgeCases:
         """Fanout for multiple arrays should reference all individual ports."""
         content, _ = _export(multiple_arrays_rdl, unroll=True)
 
-        # All individual ports should be referenced
-        for i in range(2):
-            assert f"m_apb_alpha_{i}." in content
-        for i in range(3):
-            assert f"m_apb_beta_{i}." in content
+        # All individual ports should be referenced, in declaration order
+        _assert_contains_in_order(
+            content,
+            [f"m_apb_alpha_{i}." for i in range(2)] + [f"m_apb_beta_{i}." for i in range(3)],
+        )
 
 
 # ===========================================================================
@@ -563,23 +558,18 @@ class TestUnrollConsistency:
         """
         content, _ = _export(sample_rdl, unroll=True)
 
-        # Extract the module header (everything between "module top (" and ");")
-        header_match = re.search(r"module top\s*\((.*?)\);", content, re.DOTALL)
-        assert header_match is not None
-        header = header_match.group(1)
+        # The header is everything between "module top (" and ");"
+        header, body = _split_module(content)
 
         # Find all master port names in the header
-        master_port_pattern = re.compile(r"m_apb_regs_(\d+)")
-        master_ports = master_port_pattern.findall(header)
+        master_ports = [index for index, _ in _REGS_PORT.findall(header)]
         assert len(master_ports) == 4, f"Expected 4 master ports, found {len(master_ports)}"
 
         # Each port should be referenced in the body
-        body = content[header_match.end() :]
-        for idx in master_ports:
-            port_name = f"m_apb_regs_{idx}"
-            assert port_name in body, (
-                f"Master port '{port_name}' declared in header but never referenced in body"
-            )
+        unreferenced = set(master_ports) - {index for index, _ in _REGS_PORT.findall(body)}
+        assert not unreferenced, (
+            f"Master ports {sorted(unreferenced)} declared in header but never referenced in body"
+        )
 
     def test_unrolled_output_structurally_valid(self, sample_rdl: AddrmapNode) -> None:
         """Basic structural checks on unrolled output: module/endmodule present,
@@ -598,14 +588,6 @@ class TestUnrollConsistency:
         """For multi-dimensional arrays, every declared port should be referenced in the body."""
         content, _ = _export(multidim_array_rdl, unroll=True)
 
-        # All 6 ports (2x3) should be in the header and referenced in the body
-        header_match = re.search(r"module top\s*\((.*?)\);", content, re.DOTALL)
-        assert header_match is not None
-
-        body = content[header_match.end() :]
-        for i in range(2):
-            for j in range(3):
-                port_name = f"m_apb_matrix_{i}_{j}"
-                assert port_name in body, (
-                    f"Master port '{port_name}' declared in header but never referenced in body"
-                )
+        # All 6 ports (2x3) should be referenced in the body, in row-major order
+        _, body = _split_module(content)
+        _assert_contains_in_order(body, [f"m_apb_matrix_{i}_{j}" for i in range(2) for j in range(3)])
@@ -18,12 +18,8 @@ class TestGetIndexedPath:
         };
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
-        # Get the register node by iterating through children
-        reg_node = None
-        for child in top.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        # Get the register node by name
+        reg_node = top.get_child_by_name("my_reg")
 
         assert reg_node is not None
         path = get_indexed_path(top, reg_node)
@@ -44,18 +40,10 @@ class TestGetIndexedPath:
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
         # Navigate to the nested register
-        inner_node = None
-        for child in top.children():
-            if child.inst_name == "inner":
-                inner_node = child
-                break
+        inner_node = top.get_child_by_name("inner")
         assert inner_node is not None
 
-        reg_node = None
-        for child in inner_node.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        reg_node = inner_node.get_child_by_name("my_reg")
         assert reg_node is not None
 
         path = get_indexed_path(top, reg_node)
@@ -71,11 +59,7 @@ class TestGetIndexedPath:
         };
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
-        reg_node = None
-        for child in top.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        reg_node = top.get_child_by_name("my_reg")
         assert reg_node is not None
 
         path = get_indexed_path(top, reg_node)
@@ -91,11 +75,7 @@ class TestGetIndexedPath:
         };
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
-        reg_node = None
-        for child in top.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        reg_node = top.get_child_by_name("my_reg")
         assert reg_node is not None
 
         path = get_indexed_path(top, reg_node)
@@ -116,18 +96,10 @@ class TestGetIndexedPath:
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
         # Navigate to the nested register
-        inner_node = None
-        for child in top.children():
-            if child.inst_name == "inner":
-                inner_node = child
-                break
+        inner_node = top.get_child_by_name("inner")
         assert inner_node is not None
 
-        reg_node = None
-        for child in inner_node.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        reg_node = inner_node.get_child_by_name("my_reg")
         assert reg_node is not None
 
         path = get_indexed_path(top, reg_node)
@@ -143,11 +115,7 @@ class TestGetIndexedPath:
         };
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
-        reg_node = None
-        for child in top.children():
-            if child.inst_name == "my_reg":
-                reg_node = child
-                break
+        reg_node = top.get_child_by_name("my_reg")
         assert reg_node is not None
 
         path = get_indexed_path(top, reg_node, indexer="idx")
@@ -163,11 +131,7 @@ class TestGetIndexedPath:
         };
         """
         top = compile_rdl(rdl_source, top="my_addrmap")
-        reg_node = None
-        for child in top.children():
-            if child.inst_name == "always":
-                reg_node = child
-                break
+        reg_node = top.get_child_by_name("always")
         assert reg_node is not None
 
         # With keyword filter (default) - SystemRDL identifiers can use keywords but SV can't
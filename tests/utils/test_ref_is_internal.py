@@ -1,16 +1,22 @@
 from collections.abc import Callable
 
-from systemrdl.node import AddrmapNode, Node
+from systemrdl.node import AddrmapNode
 from systemrdl.rdltypes.references import PropertyReference
 
 from peakrdl_busdecoder.utils import ref_is_internal
 
+# One internal and one external register; shared by every test so
+# compile_rdl elaborates it once.
+_REF_IS_INTERNAL_RDL = """
+reg reg_t {
+    field { sw=rw; hw=r; } data[7:0];
+};
 
-def _find_child_by_name(node: AddrmapNode, inst_name: str) -> Node:
-    for child in node.children():
-        if child.inst_name == inst_name:
-            return child
-    raise AssertionError(f"Child with name {inst_name} not found")
+addrmap top {
+    external reg_t ext @ 0x0;
+    reg_t intrnl @ 0x10;
+};
+"""
 
 
 class TestRefIsInternal:
@@ -18,22 +24,14 @@ class TestRefIsInternal:
 
     def test_external_components_flagged(self, compile_rdl: Callable[..., AddrmapNode]) -> None:
         """External components should be treated as non-internal."""
-        rdl_source = """
-        reg reg_t {
-            field { sw=rw; hw=r; } data[7:0];
-        };
-
-        addrmap top {
-            external reg_t ext @ 0x0;
-            reg_t intrnl @ 0x10;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
-
-        internal_reg = _find_child_by_name(top, "intrnl")
+        top = compile_rdl(_REF_IS_INTERNAL_RDL, top="top")
+
+        internal_reg = top.get_child_by_name("intrnl")
+        assert internal_reg is not None
         assert ref_is_internal(top, internal_reg) is True
 
-        external_reg = _find_child_by_name(top, "ext")
+        external_reg = top.get_child_by_name("ext")
+        assert external_reg is not None
         assert external_reg.external is True
         assert ref_is_internal(top, external_reg) is False
 
@@ -45,14 +43,7 @@ class TestRefIsInternal:
         self, compile_rdl: Callable[..., AddrmapNode]
     ) -> None:
         """Root-level property references should be treated as internal."""
-        rdl_source = """
-        addrmap top {
-            reg {
-                field { sw=rw; hw=r; } data[7:0];
-            } reg0 @ 0x0;
-        };
-        """
-        top = compile_rdl(rdl_source, top="top")
+        top = compile_rdl(_REF_IS_INTERNAL_RDL, top="top")
 
         prop_ref = PropertyReference.__new__(PropertyReference)
         prop_ref.node = None